@@ -5,6 +5,10 @@ https://github.com/nimroddolev/akuvox
 """
 from __future__ import annotations
 
+from functools import partial
+
+from aiohttp.hdrs import METH_GET, METH_POST
+from homeassistant.components import webhook
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
@@ -12,11 +16,21 @@ from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .config_flow import AkuvoxOptionsFlowHandler
 from .api import AkuvoxApiClient
+from .connection_pool import AkuvoxConnectionPool
+from .door_open import redact_credentials
+from .local_push import async_handle_action_url
+from .poll_scheduler import AkuvoxPollScheduler
+from .response_cache import AkuvoxResponseCache
+from .store import async_import_legacy_storage
 from .const import (
     DOMAIN,
-    LOGGER
+    LOGGER,
+    DATA_RESPONSE_CACHES,
+    DATA_POLL_SCHEDULER,
+    LOCAL_PUSH_WEBHOOK_NAME,
 )
 from .coordinator import AkuvoxDataUpdateCoordinator
+from .services import async_setup_services, async_unload_services
 
 PLATFORMS: list[Platform] = [
     Platform.CAMERA,
@@ -28,58 +42,109 @@ PLATFORMS: list[Platform] = [
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up this integration using UI."""
     hass.data.setdefault(DOMAIN, {})
+    # Storage is kept per entry: take over the integration-wide storage of older versions
+    await async_import_legacy_storage(hass, entry)
+    # The response cache outlives the client so that reloads can reuse it
+    response_cache = hass.data.setdefault(DATA_RESPONSE_CACHES, {}).setdefault(
+        entry.entry_id, AkuvoxResponseCache())
+    # One scheduler spreads the door log polls of all accounts
+    poll_scheduler = hass.data.setdefault(DATA_POLL_SCHEDULER, AkuvoxPollScheduler(hass))
     hass.data[DOMAIN][entry.entry_id] = coordinator = AkuvoxDataUpdateCoordinator(
         hass=hass,
         client=AkuvoxApiClient(
             session=async_get_clientsession(hass),
             hass=hass,
             entry=entry,
+            connection_pool=AkuvoxConnectionPool(hass),
+            response_cache=response_cache,
+            poll_scheduler=poll_scheduler,
         ),
     )
-    await async_update_configuration(hass=hass, entry=entry)
+    try:
+        await async_update_configuration(hass=hass, entry=entry)
+
+        # Open connections to the account's regional hosts before the first request
+        await coordinator.client.async_prewarm_connections()
+
+        # The first refresh requests app/<type> endpoints: load or probe the account's app type first
+        await coordinator.client.async_revalidate_app_type_if_needed()
 
-    # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
-    await coordinator.async_config_entry_first_refresh()
+        # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
+        await coordinator.async_config_entry_first_refresh()
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        await async_setup_local_push(hass, coordinator.client)
+        async_setup_services(hass)
+        entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    except Exception:
+        # Setup is retried with a new client: release this one's poller and pooled session
+        hass.data[DOMAIN].pop(entry.entry_id, None)
+        await coordinator.client.async_stop_polling()
+        await coordinator.client.async_close()
+        raise
 
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Handle removal of an entry."""
-    await async_stop_polling(hass)
+    await async_stop_polling(hass, entry)
     if unloaded := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: AkuvoxDataUpdateCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        if coordinator.client.local_push_webhook_id is not None:
+            webhook.async_unregister(hass, coordinator.client.local_push_webhook_id)
+        await coordinator.client.async_close()
+        async_unload_services(hass)
     return unloaded
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Discard cached responses of a removed entry."""
+    hass.data.get(DATA_RESPONSE_CACHES, {}).pop(entry.entry_id, None)
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
-    await async_stop_polling(hass)
+    await async_stop_polling(hass, entry)
     await async_unload_entry(hass, entry)
     await async_setup_entry(hass, entry)
     await async_update_configuration(hass, entry)
-    await async_start_polling(hass)
+    await async_start_polling(hass, entry)
+
+# Local push
+
+async def async_setup_local_push(hass: HomeAssistant, client: AkuvoxApiClient):
+    """Register the webhook that receives the Action URL callbacks of the account's devices."""
+    webhook_id = await client.async_get_local_push_webhook_id()
+    # Reloads may set the entry up again before its previous webhook was removed
+    webhook.async_unregister(hass, webhook_id)
+    webhook.async_register(
+        hass,
+        DOMAIN,
+        LOCAL_PUSH_WEBHOOK_NAME,
+        webhook_id,
+        partial(async_handle_action_url, client),
+        local_only=True,
+        allowed_methods=(METH_GET, METH_POST))
 
 # Polling
 
-async def async_stop_polling(hass: HomeAssistant):
+async def async_stop_polling(hass: HomeAssistant, entry: ConfigEntry):
     """Stop polling the personal door log API."""
-    api_client: AkuvoxApiClient = get_api_client(hass=hass) # type: ignore
-    await api_client.async_stop_polling()
+    api_client: AkuvoxApiClient | None = get_api_client(hass=hass, entry=entry)
+    if api_client:
+        await api_client.async_stop_polling()
 
-async def async_start_polling(hass: HomeAssistant):
-    """Stop polling the personal door log API."""
-    api_client: AkuvoxApiClient = get_api_client(hass=hass) # type: ignore
-    await api_client.async_start_polling_personal_door_log()
+async def async_start_polling(hass: HomeAssistant, entry: ConfigEntry):
+    """Start polling the personal door log API."""
+    api_client: AkuvoxApiClient | None = get_api_client(hass=hass, entry=entry)
+    if api_client:
+        await api_client.async_start_polling_personal_door_log()
 
-def get_api_client(hass: HomeAssistant):
-    """Akuvox API Client."""
-    for _key, value in hass.data[DOMAIN].items():
-        coordinator: AkuvoxDataUpdateCoordinator = value
-        return coordinator.client
+def get_api_client(hass: HomeAssistant, entry: ConfigEntry) -> AkuvoxApiClient | None:
+    """Akuvox API Client of the config entry."""
+    coordinator: AkuvoxDataUpdateCoordinator | None = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    return coordinator.client if coordinator else None
 
 # Integration options
 
@@ -94,7 +159,7 @@ async def async_options_updated(self, entry: ConfigEntry):
     updated_options = entry.options
 
     # Print the updated options
-    LOGGER.debug("Updated Options: %s", str(updated_options))
+    LOGGER.debug("Updated Options: %s", redact_credentials(str(updated_options)))
 
 # Update
 
@@ -114,9 +179,11 @@ async def async_update_configuration(hass: HomeAssistant, entry: ConfigEntry) ->
             LOGGER.debug("Configured values:")
             for key, value in updated_options.items():
                 #                           value=value)
-                if value:
+                # Zero and False are valid settings, e.g. to disable a feature
+                if value is not None and value != "":
                     client.update_data(key, value)
-                    str_value: str = str(value)
+                    # Option values may hold URLs with credentials, e.g. the local relays
+                    str_value: str = redact_credentials(str(value))
                     if key in ["auth_token", "token"]:
                         length: int = len(str_value)
                         str_value = f"{str_value[0:3]}{'*'*int(length-6)}{str_value[int(length-3):length]}" # type: ignore
@@ -2,17 +2,62 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import socket
 import json
+import time
+from datetime import datetime
+from functools import partial
+from urllib.parse import parse_qs, urlsplit
 
-from homeassistant.core import HomeAssistant
+from homeassistant.components import webhook
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
 
 import aiohttp
 import async_timeout
-import requests
 
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+from .circuit_breaker import (
+    AkuvoxCircuitBreaker,
+    AkuvoxCircuitBreakers,
+    AkuvoxLogThrottle,
+    parse_retry_after,
+)
+from .connection_pool import AkuvoxConnectionPool
 from .data import AkuvoxData
+from .door_open import (
+    AkuvoxDoorOpenCoalescer,
+    AkuvoxDoorOpenConfirmations,
+    AkuvoxDoorOpenResult,
+    AkuvoxDoorOpenStats,
+    AkuvoxPendingDoorOpen,
+    get_local_opendoor_url,
+    normalize_mac,
+    parse_local_relays,
+    redact_credentials,
+)
 from .door_poll import DoorLogPoller
+from .local_push import AkuvoxLocalPush
+from .poll_scheduler import AkuvoxPollScheduler
+from .endpoints import (
+    AkuvoxEndpoint,
+    AkuvoxEndpointRegistry,
+    AkuvoxRenderedEndpoint,
+    ENDPOINT_OPENDOOR,
+    ENDPOINT_PERSONAL_DOOR_LOG,
+    ENDPOINT_PERSONAL_TEMP_KEY_LIST,
+    ENDPOINT_USERCONF,
+)
+from .request_scheduler import AkuvoxRequestScheduler
+from .response_cache import AkuvoxResponseCache
+from .single_flight import AkuvoxSingleFlight
 
 from .const import (
     LOGGER,
@@ -24,13 +69,43 @@ from .const import (
     API_SERVERS_LIST,
     REST_SERVER_API_VERSION,
     API_REST_SERVER_DATA,
-    USERCONF_API_VERSION,
     API_USERCONF,
-    OPENDOOR_API_VERSION,
-    API_OPENDOOR,
-    API_APP_HOST,
     API_GET_PERSONAL_TEMP_KEY_LIST,
-    API_GET_PERSONAL_DOOR_LOG
+    API_GET_PERSONAL_DOOR_LOG,
+    TEMP_KEY_QR_HOST,
+    RESPONSE_CACHE_TTL,
+    APP_TYPE_COMMUNITY,
+    APP_TYPE_SINGLE,
+    APP_TYPE_STORAGE_KEY,
+    APP_TYPE_REVALIDATE_INTERVAL,
+    APP_TYPE_REVALIDATE_AFTER_MISSES,
+    APP_TYPE_MIN_REVALIDATE_INTERVAL,
+    DOOR_LOG_EVENT,
+    PENDING_SCREENSHOT_POLL_INTERVAL,
+    CIRCUIT_CLOSED,
+    CIRCUIT_FAILURE_STATUSES,
+    ERROR_LOG_INTERVAL,
+    REQUEST_PRIORITY_INTERACTIVE,
+    REQUEST_PRIORITY_POLLING,
+    REQUEST_PRIORITY_BACKGROUND,
+    REQUEST_TIMEOUT,
+    DOOR_OPEN_CONFIRMED_EVENT,
+    DOOR_OPEN_TIMEOUT_EVENT,
+    DOOR_OPEN_CONFIRM_TIMEOUT,
+    DOOR_OPEN_BURST_INTERVAL,
+    REPLAYED_KEY,
+    LOCAL_OPENDOOR_TIMEOUT,
+    DOOR_OPEN_PATH_CLOUD,
+    DOOR_OPEN_PATH_LOCAL,
+    CAPTURE_TIME_KEY,
+    CAPTURE_TIME_FORMAT,
+    PIC_URL_KEY,
+    DOOR_SCREENSHOT_EVENT,
+    LOCAL_PUSH_DEFAULT_EVENT,
+    SOURCE_KEY,
+    SOURCE_CLOUD,
+    SOURCE_LOCAL,
+    LOCAL_PUSH_WEBHOOK_ID_KEY,
 )
 
 
@@ -45,21 +120,61 @@ class AkuvoxApiClientCommunicationError(AkuvoxApiClientError):
 class AkuvoxApiClientAuthenticationError(AkuvoxApiClientError):
     """Exception to indicate an authentication error."""
 
+
+class AkuvoxApiClientCircuitOpenError(AkuvoxApiClientCommunicationError):
+    """Exception to indicate that requests to a failing endpoint are paused."""
+
+# Returned instead of data when a response body is identical to the previous one
+RESPONSE_UNCHANGED = object()
+
+
 class AkuvoxApiClient:
     """Sample API Client."""
 
     _data: AkuvoxData = None # type: ignore
     hass: HomeAssistant
-    door_log_poller: DoorLogPoller
+    door_log_poller: DoorLogPoller | None = None
+    connection_pool: AkuvoxConnectionPool | None = None
+    poll_scheduler: AkuvoxPollScheduler | None = None
+    local_push_webhook_id: str | None = None
 
     def __init__(
         self,
         session: aiohttp.ClientSession,
         hass: HomeAssistant,
         entry,
+        connection_pool: AkuvoxConnectionPool | None = None,
+        response_cache: AkuvoxResponseCache | None = None,
+        poll_scheduler: AkuvoxPollScheduler | None = None,
     ) -> None:
         """Akuvox API Client."""
-        self._session = session
+        self.connection_pool = connection_pool
+        self.poll_scheduler = poll_scheduler
+        self._entry_id: str | None = entry.entry_id if entry else None
+        self._session = connection_pool.session if connection_pool else session
+        self._single_flight = AkuvoxSingleFlight()
+        self._endpoints = AkuvoxEndpointRegistry()
+        self._circuit_breakers = AkuvoxCircuitBreakers()
+        self._request_scheduler = AkuvoxRequestScheduler()
+        self._door_open_stats = AkuvoxDoorOpenStats()
+        self._door_open_confirmations = AkuvoxDoorOpenConfirmations()
+        self._door_open_coalescer = AkuvoxDoorOpenCoalescer()
+        self._log_throttle = AkuvoxLogThrottle(ERROR_LOG_INTERVAL)
+        self._body_digests: dict[str, bytes] = {}
+        self._app_type_probed_at: float | None = None
+        self._door_log_misses: int = 0
+        self._door_log_stats: dict = {
+            "polls": 0,
+            "short_circuited": 0,
+            "stale_discarded": 0,
+            "screenshot_refetches": 0,
+        }
+        self._cancel_screenshot_refetch = None
+        self._polling: bool = False
+        self._door_log_lock = asyncio.Lock()
+        self._door_log_sequence: int = 0
+        self._door_log_processed_sequence: int = 0
+        self._response_cache = response_cache if response_cache else AkuvoxResponseCache()
         self.hass = hass
         if entry:
             LOGGER.debug("▶️ Initializing AkuvoxData from API client init")
@@ -70,7 +185,6 @@ class AkuvoxApiClient:
     async def async_init_api(self) -> bool:
         """Initialize API configuration data."""
         if self._data.host is None or len(self._data.host) == 0:
-            self._data.host = "...request in process"
             if await self.async_fetch_rest_server() is False:
                 return False
 
@@ -88,21 +202,78 @@ class AkuvoxApiClient:
                 LOGGER.error("❌ Unable to find API host address.")
                 return False
 
-        # Begin polling personal door log
-        await self.async_start_polling()
+        # Begin polling personal door log (clients of a config entry only)
+        if self._entry_id is not None:
+            await self.async_start_polling()
 
         return True
 
+    async def async_prewarm_connections(self):
+        """Pre-warm pooled connections to the account's regional hosts."""
+        if self.connection_pool:
+            await self.connection_pool.async_prewarm(self.get_regional_hosts())
+
+    async def async_close(self):
+        """Close the client's pooled connections."""
+        if self.connection_pool:
+            await self.connection_pool.async_close()
+
     async def async_start_polling(self):
         """Start polling the personal door log API."""
-        self.door_log_poller: DoorLogPoller = DoorLogPoller(
-            hass=self.hass,
-            poll_function=self.async_retrieve_personal_door_log)
-        await self.door_log_poller.async_start()
+        self._polling = True
+        if self.door_log_poller is None:
+            self.door_log_poller = DoorLogPoller(
+                hass=self.hass,
+                poll_function=self._async_scheduled_poll,
+                adaptive=self._data.adaptive_polling,
+                interval_min=self._data.poll_interval_min,
+                interval_max=self._data.poll_interval_max,
+                overlap_policy=self._data.poll_overlap_policy)
+        if self.poll_scheduler and self._entry_id is not None:
+            # Started by the shared scheduler, after a random delay
+            await self.poll_scheduler.async_add(
+                entry_id=self._entry_id,
+                account_key=(self._data.subdomain, self._data.token),
+                poller=self.door_log_poller,
+                client=self)
+        else:
+            await self.door_log_poller.async_start()
+
+    async def _async_scheduled_poll(self) -> bool:
+        """Poll the door log within the shared scheduler's concurrency cap."""
+        if self.poll_scheduler:
+            return await self.poll_scheduler.async_run(self.async_retrieve_personal_door_log)
+        return await self.async_retrieve_personal_door_log()
 
     async def async_stop_polling(self):
         """Stop polling the personal door log API."""
-        await self.door_log_poller.async_stop()
+        self._polling = False
+        if self.poll_scheduler and self._entry_id is not None:
+            await self.poll_scheduler.async_remove(self._entry_id)
+        if self._cancel_screenshot_refetch is not None:
+            self._cancel_screenshot_refetch()
+            self._cancel_screenshot_refetch = None
+        self._data.pending_screenshots.clear()
+        self._door_open_confirmations.clear()
+        self._data.local_pushes.clear()
+        if self.door_log_poller:
+            await self.door_log_poller.async_stop()
+        # The cursor is saved on a delay: write it before a reload reads it back
+        await self._data.async_flush_stored_data()
+
+    def get_polling_client(self) -> AkuvoxApiClient:
+        """Return the client polling the account's door log: this one, or that of another entry."""
+        if self.poll_scheduler and self._entry_id is not None:
+            client = self.poll_scheduler.get_polling_client(self._entry_id)
+            if client is not None:
+                return client
+        return self
+
+    def notify_door_activity(self):
+        """Switch the account's door log poller to its fastest rate."""
+        door_log_poller = self.get_polling_client().door_log_poller
+        if door_log_poller:
+            door_log_poller.notify_activity()
 
     def init_api_with_data(self,
                            hass: HomeAssistant,
@@ -139,7 +310,9 @@ class AkuvoxApiClient:
             data=None,
             headers={
                 'api-version': REST_SERVER_API_VERSION
-            }
+            },
+            coalesce=True,
+            cache_endpoint=API_REST_SERVER_DATA,
         )
         if json_data is not None:
             LOGGER.debug("✅ REST server data received successfully")
@@ -181,6 +354,7 @@ class AkuvoxApiClient:
                 url=url,
                 headers=headers,
                 data=data,
+                priority=REQUEST_PRIORITY_INTERACTIVE,
             )
             if response is not None:
                 if response["result"] == 0: # type: ignore
@@ -234,6 +408,8 @@ class AkuvoxApiClient:
             url=url,
             headers=headers,
             data=data,
+            coalesce=True,
+            cache_endpoint=API_SERVERS_LIST,
         )
         if json_data is not None:
             LOGGER.debug("✅ Server list retrieved successfully")
@@ -270,7 +446,11 @@ class AkuvoxApiClient:
             'api-version': SMS_LOGIN_API_VERSION,
             'User-Agent': 'VBell/6.61.2 (iPhone; iOS 16.6; Scale/3.00)'
         }
-        response = await self._async_api_wrapper(method="get", url=url, headers=headers, data=data)
+        response = await self._async_api_wrapper(method="get",
+                                                  url=url,
+                                                  headers=headers,
+                                                  data=data,
+                                                  priority=REQUEST_PRIORITY_INTERACTIVE)
 
         if response is not None:
             LOGGER.debug("✅ Login successful")
@@ -281,6 +461,12 @@ class AkuvoxApiClient:
 
     async def async_retrieve_user_data(self) -> bool:
         """Retrieve user devices and temp keys data."""
+        # Concurrent refreshes for the same account share a single retrieval
+        return await self._single_flight.async_do(
+            ("retrieve_user_data", self._data.token),
+            self._async_retrieve_user_data)
+
+    async def _async_retrieve_user_data(self) -> bool:
         if await self.async_make_servers_list_request(
             hass=self.hass,
             auth_token=self._data.auth_token,
@@ -302,26 +488,23 @@ class AkuvoxApiClient:
 
     async def async_retrieve_user_data_with_tokens(self, auth_token, token) -> bool:
         """Retrieve user devices and temp keys data with an alternate token string."""
-        self._data.auth_token = auth_token
-        self._data.token = token
+        self.update_data("auth_token", auth_token)
+        self.update_data("token", token)
         return await self.async_retrieve_user_data()
 
     async def async_user_conf(self):
         """Request the user's configuration data."""
         LOGGER.debug("📡 Retrieving list of user's devices...")
-        url = f"https://{self._data.host}/{API_USERCONF}?token={self._data.token}"
+        endpoint = self.get_endpoint(ENDPOINT_USERCONF)
+        url = endpoint.url
         data = {}
-        headers = {
-            "Host": self._data.host,
-            "X-AUTH-TOKEN": self._data.token,
-            "Connection": "keep-alive",
-            "api-version": USERCONF_API_VERSION,
-            "Accept": "*/*",
-            "User-Agent": "VBell/6.61.2 (iPhone; iOS 16.6; Scale/3.00)",
-            "Accept-Language": "en-AU;q=1, he-AU;q=0.9, ru-RU;q=0.8",
-            "x-cloud-lang": "en"
-        }
-        json_data = await self._async_api_wrapper(method="get", url=url, headers=headers, data=data)
+        headers = endpoint.headers
+        json_data = await self._async_api_wrapper(method="get",
+                                                  url=url,
+                                                  headers=headers,
+                                                  data=data,
+                                                  coalesce=True,
+                                                  cache_endpoint=API_USERCONF)
 
         if json_data is not None:
             LOGGER.debug("✅ User's device list retrieved successfully")
@@ -330,28 +513,144 @@ class AkuvoxApiClient:
         LOGGER.error("❌ Unable to retrieve user's device list.")
         return None
 
-    def make_opendoor_request(self, name: str, host: str, token: str, data: str):
-        """Request the user's configuration data."""
+    async def async_open_door(self, name: str, host: str, token: str, data: str) -> AkuvoxDoorOpenResult:
+        """Request the door to open and return the outcome with its round trip time.
+
+        Rapid presses of the same relay share a single request to the cloud.
+        """
+        return await self._door_open_coalescer.async_do(
+            (host, data),
+            partial(self._async_open_door, name, host, token, data),
+            self._data.door_open_coalesce_window)
+
+    async def _async_open_door(self, name: str, host: str, token: str, data: str) -> AkuvoxDoorOpenResult:
+        """Send a door open request and record its outcome.
+
+        Relays of devices with a configured LAN address are opened through
+        the device's local HTTP API first, falling back to the cloud.
+        """
+        params = parse_qs(data)
+        mac = params.get("mac", [""])[0]
+        relay_id = params.get("relay", [""])[0]
+        started_at = time.monotonic()
+        pressed_at = dt_util.now().replace(tzinfo=None)
+        error = None
+        response = None
+        path = DOOR_OPEN_PATH_LOCAL
+        if (base_url := self._data.local_relays.get(normalize_mac(mac))) is not None:
+            response = await self.async_make_local_opendoor_request(name, base_url, relay_id)
+            if response is None:
+                self._door_open_stats.local_fallbacks += 1
+        if response is None:
+            path = DOOR_OPEN_PATH_CLOUD
+            try:
+                response = await self.async_make_opendoor_request(name=name, host=host, token=token, data=data)
+            except AkuvoxApiClientError as exception:
+                LOGGER.error("❌ Request to open door failed: %s", str(exception))
+                error = str(exception)
+        if response is None and error is None:
+            error = "The door open request was rejected"
+        result = AkuvoxDoorOpenResult(
+            success=response is not None,
+            latency=time.monotonic() - started_at,
+            name=name,
+            error=error,
+            response=response,
+            path=path)
+        self._door_open_stats.record(result)
+        LOGGER.debug("🚪 Door open request for '%s' took %s ms (%s)",
+                     name,
+                     str(round(result.latency * 1000)),
+                     path)
+        if result.success:
+            # Only the polling client sees the door log entry that confirms the press
+            self.get_polling_client()._track_door_open(name, mac, relay_id, started_at, pressed_at)
+        return result
+
+    async def async_make_local_opendoor_request(self, name: str, base_url: str, relay_id: str):
+        """Request the door to open through the device's HTTP API on the LAN."""
+        try:
+            url = get_local_opendoor_url(base_url, relay_id)
+            async with async_timeout.timeout(LOCAL_OPENDOOR_TIMEOUT), self._session.get(url) as response:
+                body = await response.text()
+                if response.status == 200:
+                    LOGGER.debug("✅ Door '%s' opened over the LAN", name)
+                    return body
+                LOGGER.debug("Local door open request for '%s' failed: HTTP status code = %s",
+                             name,
+                             str(response.status))
+        except (asyncio.TimeoutError, aiohttp.ClientError, socket.gaierror, ValueError) as error:
+            # Errors about the URL may quote the device's credentials
+            LOGGER.debug("Local door open request for '%s' failed: %s",
+                         name,
+                         redact_credentials(str(error)) or type(error).__name__)
+        LOGGER.debug("Falling back to the cloud to open door '%s'", name)
+        return None
+
+    def _track_door_open(self, name: str, mac: str, relay: str, requested_at: float, pressed_at: datetime):
+        """Poll the door log in a short burst to confirm that the door opened."""
+        pending = AkuvoxPendingDoorOpen(
+            name=name,
+            mac=mac,
+            relay=relay,
+            requested_at=requested_at,
+            pressed_at=pressed_at)
+        pending.cancel_timeout = async_call_later(
+            self.hass,
+            DOOR_OPEN_CONFIRM_TIMEOUT,
+            partial(self._async_door_open_timed_out, pending))
+        self._door_open_confirmations.add(pending)
+        if self.door_log_poller:
+            self.door_log_poller.burst(DOOR_OPEN_CONFIRM_TIMEOUT, DOOR_OPEN_BURST_INTERVAL)
+
+    def _confirm_door_open(self, door_log: dict):
+        """Fire the confirmation event of the door open request matching a door log entry."""
+        if door_log.get(REPLAYED_KEY) or (match := self._door_open_confirmations.match(door_log)) is None:
+            return
+        pending, latency = match
+        if pending.cancel_timeout is not None:
+            pending.cancel_timeout()
+        LOGGER.debug("✅ Door '%s' opened %s ms after the request",
+                     pending.name,
+                     str(round(latency * 1000)))
+        self.hass.bus.async_fire(DOOR_OPEN_CONFIRMED_EVENT, {
+            "name": pending.name,
+            "mac": pending.mac,
+            "relay": pending.relay,
+            "latency": round(latency, 3),
+            "door_log": door_log,
+        })
+
+    @callback
+    def _async_door_open_timed_out(self, pending: AkuvoxPendingDoorOpen, _now):
+        """Fire the timeout event of a door open request that never showed up in the door log."""
+        if not self._door_open_confirmations.expire(pending):
+            return
+        LOGGER.warning("⏱️ Door '%s' did not show up in the door log within %s seconds of the request",
+                       pending.name,
+                       str(DOOR_OPEN_CONFIRM_TIMEOUT))
+        self.hass.bus.async_fire(DOOR_OPEN_TIMEOUT_EVENT, {
+            "name": pending.name,
+            "mac": pending.mac,
+            "relay": pending.relay,
+            "timeout": DOOR_OPEN_CONFIRM_TIMEOUT,
+        })
+
+    async def async_make_opendoor_request(self, name: str, host: str, token: str, data: str):
+        """Request the door to open."""
         LOGGER.debug("📡 Sending request to open door '%s'...", name)
         LOGGER.debug("Request data = %s", str(data))
-        url = f"https://{host}/{API_OPENDOOR}?token={token}"
-        headers = {
-            "Host": host,
-            "Content-Type": "application/x-www-form-urlencoded",
-            "X-AUTH-TOKEN": token,
-            "api-version": OPENDOOR_API_VERSION,
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-            "Accept": "*/*",
-            "User-Agent": "VBell/6.61.2 (iPhone; iOS 16.6; Scale/3.00)",
-            "Accept-Language": "en-AU;q=1, he-AU;q=0.9, ru-RU;q=0.8",
-            "Content-Length": "24",
-            "x-cloud-lang": "en",
-        }
-        response = self.post_request(url=url, headers=headers, data=data)
-        json_data = self.process_response(response, url)
+        endpoint = self.get_endpoint(ENDPOINT_OPENDOOR, host=host, token=token)
+        url = endpoint.url
+        headers = endpoint.headers
+        json_data = await self._async_api_wrapper(method="post",
+                                                  url=url,
+                                                  headers=headers,
+                                                  data=data,
+                                                  priority=REQUEST_PRIORITY_INTERACTIVE)
         if json_data is not None:
             LOGGER.debug("✅ Door open request sent successfully.")
+            self.notify_door_activity()
             return json_data
 
         LOGGER.error("❌ Request to open door failed.")
@@ -368,24 +667,17 @@ class AkuvoxApiClient:
     async def async_get_temp_key_list(self):
         """Request the user's configuration data."""
         LOGGER.debug("📡 Retrieving list of user's temporary keys...")
-        host = self.get_activities_host()
-        subdomain = self._data.subdomain # await self._data.async_get_stored_data_for_key("subdomain")
-        url = f"https://{host}/{API_GET_PERSONAL_TEMP_KEY_LIST}"
+        endpoint = self.get_endpoint(ENDPOINT_PERSONAL_TEMP_KEY_LIST)
+        url = endpoint.url
         data = {}
-        headers = {
-            "x-cloud-version": "6.4",
-            "accept": "application/json, text/plain, */*",
-            "sec-fetch-site": "same-origin",
-            "accept-language": "en-AU,en;q=0.9",
-            "sec-fetch-mode": "cors",
-            "x-cloud-lang": "en",
-            "user-agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 16_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) SmartPlus/6.2",
-            "referer": f"https://{subdomain}.akuvox.com/smartplus/TmpKey.html?TOKEN={self._data.token}&USERTYPE=20&VERSION=6.6",
-            "x-auth-token": self._data.token,
-            "sec-fetch-dest": "empty"
-        }
+        headers = endpoint.headers
 
-        json_data = await self._async_api_wrapper(method="get", url=url, headers=headers, data=data)
+        json_data = await self._async_api_wrapper(method="get",
+                                                  url=url,
+                                                  headers=headers,
+                                                  data=data,
+                                                  coalesce=True,
+                                                  cache_endpoint=API_GET_PERSONAL_TEMP_KEY_LIST)
 
         if json_data is not None:
             LOGGER.debug("✅ User's temporary keys list retrieved successfully")
@@ -397,62 +689,210 @@ class AkuvoxApiClient:
     async def async_start_polling_personal_door_log(self):
         """Poll the server contineously for the latest personal door log."""
         # Make sure only 1 instance of the door log polling is running
-        self.hass.async_create_task(self.async_retrieve_personal_door_log())
+        await self.async_start_polling()
 
     async def async_retrieve_personal_door_log(self) -> bool:
-        """Request and parse the user's door log every 2 seconds."""
-        while True:
-            # Get the latest pesonal door log
-            json_data = await self.async_get_personal_door_log()
-            if json_data is not None:
-                new_door_log = await self._data.async_parse_personal_door_log(json_data)
-                if new_door_log is not None:
-                    # Fire HA event
-                    LOGGER.debug("🚪 New door open event occurred. Firing akuvox_door_update event")
-                    event_name = "akuvox_door_update"
-                    self.hass.bus.async_fire(event_name, new_door_log)
-            await asyncio.sleep(2)  # Wait for 2 seconds before calling again
+        """Request and parse the user's latest door log.
+
+        Returns True when at least one new door event was fired.
+        """
+        self._door_log_sequence += 1
+        sequence = self._door_log_sequence
+        json_data = await self.async_get_personal_door_log()
+        self._door_log_stats["polls"] += 1
+
+        # Polls may overlap: process responses one at a time, in request order
+        async with self._door_log_lock:
+            if not self._polling:
+                # Polling stopped while the request was in flight
+                return False
+            if sequence < self._door_log_processed_sequence:
+                self._door_log_stats["stale_discarded"] += 1
+                return False
+            self._door_log_processed_sequence = sequence
+
+            new_door_logs = []
+            if json_data is RESPONSE_UNCHANGED:
+                # Same body as the previous poll: nothing new to parse
+                self._door_log_stats["short_circuited"] += 1
+            elif json_data is not None:
+                new_door_logs = await self._data.async_parse_personal_door_log(json_data)
+            # Fire the entries released by the parser or by a timeout in the order they occurred
+            new_door_logs = sorted(new_door_logs + self._data.pop_expired_door_logs(),
+                                   key=lambda door_log: str(door_log.get(CAPTURE_TIME_KEY, "")))
+            for new_door_log in new_door_logs:
+                self._fire_door_log(new_door_log)
+            self._schedule_pending_screenshot_refetch()
+            return len(new_door_logs) > 0
+
+    def _fire_door_log(self, door_log: dict):
+        """Fire the event of a polled door log entry, unless a local push already did."""
+        push = None if door_log.get(REPLAYED_KEY) else self._data.local_pushes.pop(door_log)
+        if push is None:
+            # Fire HA event
+            LOGGER.debug("🚪 New door open event occurred. Firing %s event", DOOR_LOG_EVENT)
+            self.hass.bus.async_fire(DOOR_LOG_EVENT, {**door_log, SOURCE_KEY: SOURCE_CLOUD})
+            self._confirm_door_open(door_log)
+            return
+        # The cloud entry of a pushed event only adds its screenshot
+        if door_log.get(PIC_URL_KEY, "") == "":
+            return
+        LOGGER.debug("📷 Screenshot of a pushed door event received. Firing %s event", DOOR_SCREENSHOT_EVENT)
+        self.hass.bus.async_fire(DOOR_SCREENSHOT_EVENT, {**push.door_log, **door_log, SOURCE_KEY: SOURCE_CLOUD})
+
+    async def async_get_local_push_webhook_id(self) -> str:
+        """Return the ID of the account's Action URL webhook, generated and persisted on first use."""
+        if self.local_push_webhook_id is None:
+            webhook_id = await self._data.async_get_stored_data_for_key(LOCAL_PUSH_WEBHOOK_ID_KEY)
+            if not webhook_id:
+                webhook_id = webhook.async_generate_id()
+                await self._data.async_set_stored_data_for_key(LOCAL_PUSH_WEBHOOK_ID_KEY, webhook_id)
+            self.local_push_webhook_id = webhook_id
+        return self.local_push_webhook_id
+
+    @callback
+    def async_handle_local_push(self, params: dict):
+        """Fire the door event pushed by a device's Action URL callback.
+
+        The event is fired right away with the data known locally. The
+        matching cloud door log entry is not fired again when polled.
+        Pushes are handled by the client polling the account's door log.
+        """
+        if (client := self.get_polling_client()) is not self:
+            client.async_handle_local_push(params)
+            return
+        mac = normalize_mac(params.get("mac", ""))
+        relay = str(params.get("relay", ""))
+        event = str(params.get("event", "")) or LOCAL_PUSH_DEFAULT_EVENT
+        captured_at = dt_util.now().replace(tzinfo=None)
+        relay_data = next((door_relay for door_relay in self._data.door_relay_data
+                           if normalize_mac(door_relay["mac"]) == mac
+                           and relay in ("", str(door_relay["relay_id"]))), None)
+        door_log = {
+            "MAC": relay_data["mac"] if relay_data else mac,
+            "Relay": relay,
+            "Location": relay_data["name"] if relay_data else "",
+            "RelayName": relay_data["door_name"] if relay_data and relay else "",
+            "Initiator": str(params.get("initiator", "")),
+            "CaptureType": event,
+            CAPTURE_TIME_KEY: captured_at.strftime(CAPTURE_TIME_FORMAT),
+            PIC_URL_KEY: "",
+            REPLAYED_KEY: False,
+            SOURCE_KEY: SOURCE_LOCAL,
+        }
+        push = AkuvoxLocalPush(mac=mac, relay=relay, event=event, door_log=door_log, captured_at=captured_at)
+        if not self._data.local_pushes.add(push):
+            LOGGER.debug("Ignoring repeated Action URL callback from %s", mac)
+            return
+        LOGGER.debug("⚡ Door event pushed by %s. Firing %s event", mac, DOOR_LOG_EVENT)
+        self.hass.bus.async_fire(DOOR_LOG_EVENT, door_log)
+        self._confirm_door_open(door_log)
+        # Poll at the fastest rate for the screenshot of the cloud entry
+        self.notify_door_activity()
+
+    def _schedule_pending_screenshot_refetch(self):
+        """Re-fetch the door log shortly while door events wait for a screenshot."""
+        if not self._polling or self._cancel_screenshot_refetch is not None \
+                or len(self._data.pending_screenshots) == 0:
+            return
+        self._cancel_screenshot_refetch = async_call_later(
+            self.hass,
+            PENDING_SCREENSHOT_POLL_INTERVAL,
+            self._async_refetch_pending_screenshots)
+
+    async def _async_refetch_pending_screenshots(self, _now):
+        """Poll the door log for the screenshots of pending door events."""
+        self._cancel_screenshot_refetch = None
+        if not self._polling:
+            return
+        self._door_log_stats["screenshot_refetches"] += 1
+        await self.async_retrieve_personal_door_log()
 
     async def async_get_personal_door_log(self):
         """Request the user's personal door log data."""
         # LOGGER.debug("📡 Retrieving list of user's personal door log...")
-        host = self.get_activities_host()
-        url = f"https://{host}/{API_GET_PERSONAL_DOOR_LOG}"
-        data = {}
-        headers = {
-            "x-cloud-version": "6.4",
-            "accept": "application/json, text/plain, */*",
-            "sec-fetch-site": "same-origin",
-            "accept-language": "en-AU,en;q=0.9",
-            "sec-fetch-mode": "cors",
-            "x-cloud-lang": "en",
-            "user-agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 17_0_2 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) SmartPlus/6.2",
-            "referer": f"https://{self._data.subdomain}.akuvox.com/smartplus/Activities.html?TOKEN={self._data.token}",
-            "x-auth-token": self._data.token,
-            "sec-fetch-dest": "empty"
-        }
-
-        json_data: list = await self._async_api_wrapper(method="get",
-                                                        url=url,
-                                                        headers=headers,
-                                                        data=data) # type: ignore
-
-        # Response empty, try changing app type "single" <--> "community"
-        if json_data is not None and len(json_data) == 0:
-            self.switch_activities_host()
-            host = self.get_activities_host()
-            url = f"https://{host}/{API_GET_PERSONAL_DOOR_LOG}"
-            json_data = await self._async_api_wrapper(method="get",
-                                                      url=url,
-                                                      headers=headers,
-                                                      data=data) # type: ignore
-
-        if json_data is not None and len(json_data) > 0:
+        await self.async_revalidate_app_type_if_needed()
+        try:
+            json_data = await self._async_request_personal_door_log()
+        except AkuvoxApiClientCircuitOpenError:
+            # Requests are paused while the endpoint keeps failing
+            return None
+        except AkuvoxApiClientCommunicationError as error:
+            LOGGER.debug("Personal door log request failed: %s", str(error))
+            json_data = None
+        if json_data is RESPONSE_UNCHANGED or (json_data is not None and len(json_data) > 0):
+            self._door_log_misses = 0
+            self._log_throttle.reset("door_log")
             return json_data
 
-        LOGGER.error("❌ Unable to retrieve user's personal door log")
+        # Empty responses or failures may mean the account's app type changed
+        self._door_log_misses += 1
+        if (suppressed := self._log_throttle.should_log("door_log")) is not None:
+            LOGGER.error("❌ Unable to retrieve user's personal door log%s",
+                         f" ({suppressed} similar errors since the last one)" if suppressed else "")
         return None
 
+    async def _async_request_personal_door_log(self, app_type: str | None = None):
+        endpoint = self.get_endpoint(ENDPOINT_PERSONAL_DOOR_LOG,
+                                     app_type=app_type,
+                                     rows=self._data.door_log_rows)
+        return await self._async_api_wrapper(method="get",
+                                             url=endpoint.url,
+                                             headers=endpoint.headers,
+                                             data={},
+                                             skip_unchanged=app_type is None,
+                                             priority=REQUEST_PRIORITY_POLLING)
+
+    async def async_discover_app_type(self, force: bool = False) -> str:
+        """Determine whether the account uses the "community" or "single" API.
+
+        The result is persisted, so the probe requests are only sent on the
+        first setup, on the slow revalidation schedule or after repeated
+        empty/failed door log polls.
+        """
+        if not force:
+            stored_app_type = await self._data.async_get_stored_data_for_key(APP_TYPE_STORAGE_KEY)
+            if stored_app_type in (APP_TYPE_COMMUNITY, APP_TYPE_SINGLE):
+                self._data.app_type = stored_app_type
+                if self._app_type_probed_at is None:
+                    self._app_type_probed_at = time.monotonic()
+                return stored_app_type
+
+        self._app_type_probed_at = time.monotonic()
+        self._door_log_misses = 0
+        current_app_type = self._data.app_type if self._data.app_type == APP_TYPE_SINGLE else APP_TYPE_COMMUNITY
+        for app_type in (current_app_type, APP_TYPE_SINGLE if current_app_type == APP_TYPE_COMMUNITY else APP_TYPE_COMMUNITY):
+            try:
+                json_data = await self._async_request_personal_door_log(app_type)
+            except AkuvoxApiClientError as error:
+                LOGGER.debug("Door log probe for app type '%s' failed: %s", app_type, str(error))
+                continue
+            if json_data is not None and len(json_data) > 0:
+                if app_type != self._data.app_type:
+                    LOGGER.debug("Using the '%s' API for the personal door log", app_type)
+                self._data.app_type = app_type
+                await self._data.async_set_stored_data_for_key(APP_TYPE_STORAGE_KEY, app_type)
+                return app_type
+
+        # No conclusive answer: keep the current app type and try again later
+        self._data.app_type = current_app_type
+        return current_app_type
+
+    async def async_revalidate_app_type_if_needed(self):
+        """Discover the app type at setup, then re-probe it on its slow schedule or after repeated misses."""
+        if self._app_type_probed_at is None:
+            # Overlapping polls share a single discovery
+            await self._single_flight.async_do(("discover_app_type",), self.async_discover_app_type)
+            return
+        elapsed = time.monotonic() - self._app_type_probed_at
+        if elapsed >= APP_TYPE_REVALIDATE_INTERVAL or (
+            self._door_log_misses >= APP_TYPE_REVALIDATE_AFTER_MISSES
+            and elapsed >= APP_TYPE_MIN_REVALIDATE_INTERVAL):
+            LOGGER.debug("Revalidating the account's door log app type...")
+            await self._single_flight.async_do(
+                ("discover_app_type",),
+                lambda: self.async_discover_app_type(force=True))
+
     ###################
     # Request Methods #
     ###################
@@ -463,41 +903,54 @@ class AkuvoxApiClient:
         url: str,
         data,
         headers: dict | None = None,
+        coalesce: bool = False,
+        cache_endpoint: str | None = None,
+        skip_unchanged: bool = False,
+        priority: int = REQUEST_PRIORITY_BACKGROUND,
     ):
-        """Get information from the API."""
+        """Get information from the API.
+
+        With coalesce set, concurrent identical requests for the same token
+        share a single in-flight request and its result. With cache_endpoint
+        set, the response is cached for that endpoint's RESPONSE_CACHE_TTL.
+        With skip_unchanged set, RESPONSE_UNCHANGED is returned without
+        decoding when the body is identical to the URL's previous response.
+        Requests are sent in the order of their priority class.
+        """
+        circuit_breaker = self._circuit_breakers.get(urlsplit(url).path)
         try:
-            async with async_timeout.timeout(10):
-                func = self.post_request if method == "post" else self.get_request
-                subdomain = self._data.subdomain
-                url = url.replace("subdomain.", f"{subdomain}.")
-                if not url.endswith(API_GET_PERSONAL_DOOR_LOG):
-                    LOGGER.debug("⏳ Sending request to %s", url)
-                response = await self.hass.async_add_executor_job(func, url, headers, data, 10)
-                return self.process_response(response, url)
-
+            if "subdomain." in url:
+                url = url.replace("subdomain.", f"{self._data.subdomain}.")
+            request_key = (method, url, str(data), self._data.token)
+            cache_ttl = RESPONSE_CACHE_TTL.get(cache_endpoint, 0)
+            if cache_ttl > 0:
+                cached_data = self._response_cache.get_fresh(request_key)
+                if cached_data is not None:
+                    return cached_data
+            if not circuit_breaker.allow_request():
+                raise AkuvoxApiClientCircuitOpenError(
+                    f"Requests to {circuit_breaker.name} are paused for "
+                    f"{round(circuit_breaker.get_retry_in())} seconds")
+            if API_GET_PERSONAL_DOOR_LOG not in url:
+                LOGGER.debug("⏳ Sending request to %s", url)
+            cache_key = request_key if cache_ttl > 0 else None
+            request = partial(self._async_make_timed_request, method, url, headers, data, cache_key, cache_ttl,
+                              skip_unchanged and not coalesce, circuit_breaker)
+            if coalesce:
+                return await self._single_flight.async_do(
+                    request_key,
+                    lambda: self._request_scheduler.async_run(priority, request))
+            return await self._request_scheduler.async_run(priority, request)
+
+        except AkuvoxApiClientError:
+            raise
         except asyncio.TimeoutError as exception:
-            # Fix for accounts which use the "single" endpoint instead of "community"
-            app_type_1 = "community"
-            app_type_2 = "single"
-            if f"app/{app_type_1}/" in url:
-                LOGGER.warning("Request 'app/%s' API %s request timed out: %s - Retry using '%s'",
-                               app_type_1,
-                               method,
-                               url,
-                               app_type_2)
-                self._data.app_type = app_type_2
-                url = url.replace("app/"+app_type_1+"/", "app/"+app_type_2+"/")
-                return await self._async_api_wrapper(method, url, data, headers)
-            if f"app/{app_type_2}/" in url:
-                LOGGER.error("Timeout occured for 'app/%s' API %s request: %s",
-                             app_type_2,
-                             method,
-                             url)
-                self._data.app_type = app_type_1
+            self._record_circuit_failure(circuit_breaker)
             raise AkuvoxApiClientCommunicationError(
                 f"Timeout error fetching information: {exception}",
             ) from exception
         except (aiohttp.ClientError, socket.gaierror) as exception:
+            self._record_circuit_failure(circuit_breaker)
             raise AkuvoxApiClientCommunicationError(
                 f"Error fetching information: {exception}",
             ) from exception
@@ -507,15 +960,34 @@ class AkuvoxApiClient:
             ) from exception
         return None
 
-    def process_response(self, response, url):
-        """Process response and return dict with data."""
-        if response.status_code == 200:
+    async def _async_make_timed_request(self, *args):
+        """Make an HTTP request, timing out REQUEST_TIMEOUT seconds after the scheduler granted its slot.
+
+        Time spent waiting in the scheduler's queue is local congestion: it
+        must not count as a failure of the endpoint.
+        """
+        async with async_timeout.timeout(REQUEST_TIMEOUT):
+            return await self.async_make_request(*args)
+
+    def process_response(self,
+                         status: int,
+                         body: bytes,
+                         url: str,
+                         circuit_breaker: AkuvoxCircuitBreaker | None = None):
+        """Process response and return dict with data.
+
+        The circuit breaker of the endpoint records HTTP 200 responses as
+        failures when the cloud rejects the request in the body, e.g.
+        because of an invalid token.
+        """
+        if status == 200:
             # Assuming the response is valid JSON, parse it
             try:
-                json_data = response.json()
+                json_data = json_loads(body)
 
                 # Standard requests
                 if "result" in json_data and json_data["result"] == 0:
+                    self._record_circuit_success(circuit_breaker)
                     if "datas" in json_data:
                         return json_data["datas"]
                     return json_data
@@ -523,19 +995,26 @@ class AkuvoxApiClient:
                 # Temp key requests
                 if "code" in json_data:
                     if json_data["code"] == 0:
+                        self._record_circuit_success(circuit_breaker)
                         if "data" in json_data:
                             return json_data["data"]
                         return json_data
+                    self._record_circuit_failure(circuit_breaker)
                     return []
 
-                LOGGER.warning("🤨 Response: %s", str(json_data))
+                self._record_circuit_failure(circuit_breaker)
+                if (suppressed := self._log_throttle.should_log(f"response {urlsplit(url).path}")) is not None:
+                    LOGGER.warning("🤨 Response: %s%s",
+                                   str(json_data),
+                                   f" ({suppressed} similar responses since the last one)" if suppressed else "")
             except Exception as error:
+                self._record_circuit_failure(circuit_breaker)
                 LOGGER.error("❌ Error occurred when parsing JSON: %s\nRequest: %s",
                              error,
                              url)
         else:
             LOGGER.debug("❌ Error: HTTP status code = %s for request to %s",
-                         response.status_code,
+                         status,
                          url)
         return None
 
@@ -547,40 +1026,83 @@ class AkuvoxApiClient:
         """Make an HTTP post request."""
         return await self.async_make_request("post", url, headers, data)
 
-    async def async_make_request(self, request_type, url, headers, data=None):
-        """Make an HTTP request."""
-        func = self._session.post if request_type == "post" else self._session.get
+    async def async_make_request(self,
+                                 request_type,
+                                 url,
+                                 headers,
+                                 data=None,
+                                 cache_key=None,
+                                 cache_ttl=0,
+                                 skip_unchanged=False,
+                                 circuit_breaker: AkuvoxCircuitBreaker | None = None):
+        """Make an HTTP request on the shared aiohttp session.
+
+        The session keeps connections alive between requests and transparently
+        decodes gzip/deflate encoded response bodies. Requests with a cache_key
+        are revalidated against the cached response's validators.
+        """
+        if cache_key is not None:
+            headers = {**(headers or {}), **self._response_cache.get_conditional_headers(cache_key)}
+        async with self._session.request(request_type.upper(),
+                                         url,
+                                         headers=headers,
+                                         data=data or None) as response:
+            self._record_circuit_outcome(circuit_breaker, response)
+            if response.status == 304 and cache_key is not None:
+                cached_data = self._response_cache.revalidate(cache_key, cache_ttl)
+                if cached_data is not None:
+                    return cached_data
+            body = await response.read()
+            if skip_unchanged and response.status == 200:
+                digest = hashlib.blake2b(body, digest_size=16).digest()
+                if self._body_digests.get(url) == digest:
+                    # Identical to the previous body, which the cloud accepted
+                    self._record_circuit_success(circuit_breaker)
+                    return RESPONSE_UNCHANGED
+                json_data = self.process_response(response.status, body, url, circuit_breaker)
+                # Only remember bodies that were processed into non-empty data
+                if json_data:
+                    self._body_digests[url] = digest
+                else:
+                    self._body_digests.pop(url, None)
+                return json_data
+            json_data = self.process_response(response.status, body, url, circuit_breaker)
+            if cache_key is not None and json_data is not None:
+                self._response_cache.store(cache_key, json_data, cache_ttl, response.headers)
+            return json_data
 
-        response = await func(url=url, headers=headers, data=data)
-        if response is not None:
-            if response.status == 200:
-                # Assuming the response is valid JSON, parse it
-                try:
-                    json_data = response.json()
-                    return json_data
-                except Exception as error:
-                    LOGGER.warning(
-                        "❌ Error occurred when parsing JSON: %s", error)
-            else:
-                LOGGER.debug("❌ Error: HTTP status code %s",
-                             response.status)
-                return None
-
-    def post_request(self, url, headers, data="", timeout=10):
-        """Make a synchronous post request."""
-        response: requests.Response = requests.post(url,
-                                                    headers=headers,
-                                                    data=data,
-                                                    timeout=timeout)
-        return response
-
-    def get_request(self, url, headers, data, timeout=10):
-        """Make a synchronous post request."""
-        response: requests.Response = requests.get(url,
-                                                   headers=headers,
-                                                   data=data,
-                                                   timeout=timeout)
-        return response
+    def _record_circuit_outcome(self, circuit_breaker: AkuvoxCircuitBreaker | None, response):
+        """Update an endpoint's circuit breaker with the HTTP status of its response.
+
+        The outcome of HTTP 200 responses depends on their body, see process_response.
+        """
+        if response.status >= 500 or response.status in CIRCUIT_FAILURE_STATUSES:
+            retry_after = None
+            if response.status == 429:
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            self._record_circuit_failure(circuit_breaker, retry_after)
+        elif response.status != 200:
+            self._record_circuit_success(circuit_breaker)
+
+    def _record_circuit_success(self, circuit_breaker: AkuvoxCircuitBreaker | None):
+        """Record a successful request, closing the endpoint's circuit."""
+        if circuit_breaker is None:
+            return
+        if circuit_breaker.state != CIRCUIT_CLOSED:
+            LOGGER.info("✅ Requests to %s succeed again", circuit_breaker.name)
+        circuit_breaker.record_success()
+
+    def _record_circuit_failure(self,
+                                circuit_breaker: AkuvoxCircuitBreaker | None,
+                                retry_after: float | None = None):
+        """Record a failed request, logging when the endpoint's circuit opens."""
+        if circuit_breaker is None:
+            return
+        if circuit_breaker.record_failure(retry_after):
+            LOGGER.warning("🔌 %s failed requests to %s. Pausing requests for %s seconds.",
+                           str(circuit_breaker.consecutive_failures),
+                           circuit_breaker.name,
+                           str(round(circuit_breaker.get_retry_in())))
 
     ###########
     # Getters #
@@ -590,10 +1112,90 @@ class AkuvoxApiClient:
         """Title of Akuvox account."""
         return self._data.project_name
 
+    def get_host(self) -> str:
+        """Return the API host of the Akuvox account."""
+        return self._data.host
+
+    def get_token(self) -> str:
+        """Return the token of the Akuvox account."""
+        return self._data.token
+
     def get_devices_json(self) -> dict:
         """Device data dictionary."""
         return self._data.get_device_data()
 
+    async def async_save_devices_json(self, data: dict):
+        """Persist the device data dictionary."""
+        await self._data.async_save_device_data(data)
+
+    async def async_load_devices_json(self) -> dict | None:
+        """Load the device data dictionary persisted for the client's entry."""
+        return await self._data.async_load_device_data()
+
+    def get_regional_hosts(self) -> list[str]:
+        """Hosts of the account's regional Akuvox servers."""
+        subdomain = self._data.subdomain
+        hosts = [
+            f"{REST_SERVER_ADDR}:{REST_SERVER_PORT}".replace("subdomain.", f"{subdomain}."),
+            TEMP_KEY_QR_HOST.replace("subdomain.", f"{subdomain}."),
+        ]
+        if self._data.host:
+            hosts.append(self._data.host)
+        return hosts
+
+    def get_request_stats(self) -> dict:
+        """Return request coalescing statistics."""
+        return self._single_flight.get_stats()
+
+    def get_response_cache_stats(self) -> dict:
+        """Return response cache statistics."""
+        return self._response_cache.get_stats()
+
+    def get_poll_interval(self) -> float | None:
+        """Return the door log poller's current interval in seconds."""
+        return self.door_log_poller.get_interval() if self.door_log_poller else None
+
+    def get_door_log_stats(self) -> dict:
+        """Return door log polling statistics."""
+        return {
+            **self._door_log_stats,
+            "adaptive_polling": self._data.adaptive_polling,
+            "poll_interval": self.get_poll_interval(),
+            "poller": self.door_log_poller.get_stats() if self.door_log_poller else None,
+            "app_type": self.get_app_type(),
+            "consecutive_misses": self._door_log_misses,
+            "dedupe": self._data.door_event_dedupe.get_stats(),
+            "pending_screenshots": self._data.pending_screenshots.get_stats(),
+        }
+
+    def get_door_open_stats(self) -> dict:
+        """Return door open request and confirmation statistics."""
+        return {
+            **self._door_open_stats.get_stats(),
+            **self._door_open_coalescer.get_stats(),
+            "confirmation": self._door_open_confirmations.get_stats(),
+        }
+
+    def get_local_push_stats(self) -> dict:
+        """Return statistics of the door events pushed on the LAN."""
+        return self._data.local_pushes.get_stats()
+
+    def get_request_scheduler_stats(self) -> dict:
+        """Return request queue wait statistics per priority class."""
+        return self._request_scheduler.get_stats()
+
+    def get_circuit_state(self) -> str:
+        """Return the worst circuit breaker state across the API endpoints."""
+        return self._circuit_breakers.get_state()
+
+    def get_circuit_breaker_stats(self) -> dict:
+        """Return per-endpoint circuit breaker statistics."""
+        return self._circuit_breakers.get_stats()
+
+    def get_endpoint_stats(self) -> dict:
+        """Return endpoint rendering statistics."""
+        return self._endpoints.get_stats()
+
     def get_obfuscated_phone_number(self, phone_number):
         """Obfuscate the user's phone number for API requests."""
         if (phone_number is None or len(phone_number) == 0):
@@ -615,24 +1217,44 @@ class AkuvoxApiClient:
             transformed_str += str(transformed_digit)
         return int(transformed_str)
 
-    def get_activities_host(self):
-        """Get the host address string for activities API requests."""
-        if self._data.app_type == "single":
-            return API_APP_HOST + "single"
-        return API_APP_HOST + "community"
-
-    def switch_activities_host(self):
-        """Switch the activities host from single <--> community."""
-        if self._data.app_type == "single":
-            LOGGER.debug("Switching API address from 'single' to 'community'")
-            self._data.app_type = "community"
-        else:
-            self._data.app_type = "single"
-            LOGGER.debug("Switching API address from 'community' to 'single'")
+    def get_endpoint(self,
+                     endpoint: AkuvoxEndpoint,
+                     host: str | None = None,
+                     token: str | None = None,
+                     app_type: str | None = None,
+                     **params) -> AkuvoxRenderedEndpoint:
+        """Return an endpoint's URL and headers rendered for the current account data."""
+        return self._endpoints.get(
+            endpoint,
+            host=host if host is not None else self._data.host,
+            subdomain=self._data.subdomain,
+            app_type=app_type or self.get_app_type(),
+            token=token if token is not None else self._data.token,
+            **params)
+
+    def get_app_type(self) -> str:
+        """Return the API app type used by the account: "community" or "single"."""
+        return APP_TYPE_SINGLE if self._data.app_type == APP_TYPE_SINGLE else APP_TYPE_COMMUNITY
 
     def update_data(self, key, value):
         """Update the data model."""
+        if key in ("subdomain", "auth_token", "token") and getattr(self._data, key) != value:
+            self._response_cache.invalidate()
         self._data.subdomain = value if key == "subdomain" else self._data.subdomain
         self._data.auth_token = value if key == "auth_token" else self._data.auth_token
         self._data.token = value if key == "token" else self._data.token
         self._data.wait_for_image_url = value if key == "wait_for_image_url" else self._data.wait_for_image_url
+        if key == "door_log_rows":
+            self._data.door_log_rows = max(1, int(value))
+        if key == "door_open_coalesce_window":
+            self._data.door_open_coalesce_window = max(0.0, float(value))
+        if key == "local_relays":
+            self._data.local_relays = parse_local_relays(value)
+        if key in ("adaptive_polling", "poll_interval_min", "poll_interval_max", "poll_overlap_policy"):
+            setattr(self._data, key, value)
+            if self.door_log_poller:
+                self.door_log_poller.configure(
+                    adaptive=self._data.adaptive_polling,
+                    interval_min=self._data.poll_interval_min,
+                    interval_max=self._data.poll_interval_max,
+                    overlap_policy=self._data.poll_overlap_policy)
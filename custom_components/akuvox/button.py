@@ -1,28 +1,28 @@
 """Button platform for akuvox."""
 from homeassistant.components.button import ButtonEntity
-from homeassistant.helpers import storage
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import DeviceInfo
 
 from .api import AkuvoxApiClient
+from .door_open import AkuvoxDoorOpenResult
 from .coordinator import AkuvoxDataUpdateCoordinator
 from .const import (
     DOMAIN,
     LOGGER,
     NAME,
     VERSION,
-    DATA_STORAGE_KEY
 )
 from .entity import AkuvoxEntity
 
 async def async_setup_entry(hass, entry, async_add_devices):
     """Set up the door relay platform."""
-    coordinator: AkuvoxDataUpdateCoordinator
-    for _key, value in hass.data[DOMAIN].items():
-        coordinator = value
+    coordinator: AkuvoxDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
     client = coordinator.client
 
-    store = storage.Store(hass, 1, DATA_STORAGE_KEY)
-    device_data: dict = await store.async_load() # type: ignore
+    device_data = await coordinator.async_get_device_data()
+    if not device_data:
+        LOGGER.error("No device data found")
+        return
     door_relay_data = device_data["door_relay_data"]
 
     entities = []
@@ -87,12 +87,29 @@ class AkuvoxDoorRelayEntity(ButtonEntity, AkuvoxEntity):
             manufacturer=NAME,
         )
 
-    def press(self) -> None:
+    async def async_press(self) -> None:
         """Trigger the door relay."""
-        self._client.make_opendoor_request(
+        result = await self.async_open_door()
+        if not result.success:
+            # Let the UI show that the door did not open
+            raise HomeAssistantError(result.error or f"Unable to open door '{self._name}'")
+
+    async def async_open_door(self) -> AkuvoxDoorOpenResult:
+        """Trigger the door relay and return the outcome of the request."""
+        result = await self._client.async_open_door(
             name=self._name,
             host=self._host,
             token=self._token,
             data=self._data
         )
+        # Expose the outcome and round trip time of the latest press
+        self._attr_extra_state_attributes = {
+            "last_press_success": result.success,
+            "last_press_latency_ms": round(result.latency * 1000),
+            "last_press_error": result.error,
+            "last_press_coalesced": result.coalesced,
+            "last_press_path": result.path,
+        }
+        self.async_write_ha_state()
+        return result
 
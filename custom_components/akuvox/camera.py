@@ -2,21 +2,21 @@
 
 from collections.abc import Callable, Awaitable
 
-from homeassistant.helpers import storage
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.const import ATTR_IDENTIFIERS, CONF_NAME, CONF_VERIFY_SSL
 from homeassistant.core import HomeAssistant
 from homeassistant.components.generic.camera import GenericCamera
 
-from .const import DOMAIN, LOGGER, NAME, VERSION, DATA_STORAGE_KEY
+from .const import DOMAIN, LOGGER, NAME, VERSION
+from .coordinator import AkuvoxDataUpdateCoordinator
 
 
 async def async_setup_entry(hass: HomeAssistant,
-                            _entry,
+                            entry,
                             async_add_devices: Callable[[list], Awaitable[None]]):
     """Set up the camera platform."""
-    store = storage.Store(hass, 1, DATA_STORAGE_KEY)
-    device_data = await store.async_load()
+    coordinator: AkuvoxDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    device_data = await coordinator.async_get_device_data()
 
     if not device_data:
         LOGGER.error("No device data found")
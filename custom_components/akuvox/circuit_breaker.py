@@ -0,0 +1,169 @@
+"""Per-endpoint circuit breakers for the Akuvox cloud API."""
+from __future__ import annotations
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+from .const import (
+    CIRCUIT_BACKOFF_MAX,
+    CIRCUIT_BACKOFF_MIN,
+    CIRCUIT_CLOSED,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+    CIRCUIT_PROBE_TIMEOUT,
+    CIRCUIT_STATES,
+)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Return the delay in seconds of an HTTP Retry-After header value."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class AkuvoxCircuitBreaker:
+    """Circuit breaker guarding a single API endpoint.
+
+    The circuit opens after CIRCUIT_FAILURE_THRESHOLD consecutive failures
+    and rejects requests for a jittered, exponentially growing delay (or the
+    server's Retry-After delay). Once the delay passes it is half-open and
+    lets a single probe request through: success closes the circuit, failure
+    opens it again with a longer delay.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Initialize the circuit breaker."""
+        self.name = name
+        self.state: str = CIRCUIT_CLOSED
+        self.consecutive_failures: int = 0
+        self._open_count: int = 0
+        self._open_until: float = 0.0
+        self._probe_started_at: float | None = None
+        self._stats: dict = {
+            "failures": 0,
+            "opened": 0,
+            "rejected": 0,
+            "retry_after": 0,
+        }
+
+    def allow_request(self) -> bool:
+        """Return True if a request may be sent to the endpoint now."""
+        if self.state == CIRCUIT_OPEN and time.monotonic() >= self._open_until:
+            self.state = CIRCUIT_HALF_OPEN
+            self._probe_started_at = None
+        if self.state == CIRCUIT_CLOSED:
+            return True
+        # Let a single probe through, or another one if the last probe never finished
+        if self.state == CIRCUIT_HALF_OPEN and (
+                self._probe_started_at is None
+                or time.monotonic() - self._probe_started_at > CIRCUIT_PROBE_TIMEOUT):
+            self._probe_started_at = time.monotonic()
+            return True
+        self._stats["rejected"] += 1
+        return False
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        self.state = CIRCUIT_CLOSED
+        self.consecutive_failures = 0
+        self._open_count = 0
+        self._probe_started_at = None
+
+    def record_failure(self, retry_after: float | None = None) -> bool:
+        """Record a failed request. Returns True if this opened the circuit."""
+        self._stats["failures"] += 1
+        self.consecutive_failures += 1
+        self._probe_started_at = None
+        if retry_after is not None:
+            self._stats["retry_after"] += 1
+        elif self.state != CIRCUIT_HALF_OPEN and self.consecutive_failures < CIRCUIT_FAILURE_THRESHOLD:
+            return False
+
+        if retry_after is not None:
+            delay = retry_after
+        else:
+            # Full jitter on the exponential backoff spreads out the retries
+            backoff = min(CIRCUIT_BACKOFF_MAX, CIRCUIT_BACKOFF_MIN * 2 ** self._open_count)
+            delay = random.uniform(backoff / 2, backoff)
+        was_open = self.state == CIRCUIT_OPEN
+        self.state = CIRCUIT_OPEN
+        self._open_count += 1
+        self._open_until = time.monotonic() + delay
+        self._stats["opened"] += 1
+        return not was_open
+
+    def get_retry_in(self) -> float:
+        """Return the seconds left until the open circuit lets a probe through."""
+        if self.state != CIRCUIT_OPEN:
+            return 0.0
+        return max(0.0, self._open_until - time.monotonic())
+
+    def get_stats(self) -> dict:
+        """Return circuit breaker statistics."""
+        return {
+            **self._stats,
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "retry_in": round(self.get_retry_in(), 1),
+        }
+
+
+class AkuvoxCircuitBreakers:
+    """Circuit breakers of an account, one per API endpoint."""
+
+    def __init__(self) -> None:
+        """Initialize the registry."""
+        self._breakers: dict[str, AkuvoxCircuitBreaker] = {}
+
+    def get(self, name: str) -> AkuvoxCircuitBreaker:
+        """Return the circuit breaker of an endpoint."""
+        if (breaker := self._breakers.get(name)) is None:
+            breaker = self._breakers[name] = AkuvoxCircuitBreaker(name)
+        return breaker
+
+    def get_state(self) -> str:
+        """Return the worst circuit state across all endpoints."""
+        states = {breaker.state for breaker in self._breakers.values()}
+        for state in reversed(CIRCUIT_STATES):
+            if state in states:
+                return state
+        return CIRCUIT_CLOSED
+
+    def get_stats(self) -> dict:
+        """Return the statistics of every endpoint's circuit breaker."""
+        return {name: breaker.get_stats() for name, breaker in self._breakers.items()}
+
+
+class AkuvoxLogThrottle:
+    """Let a repeated log message through at most once per interval."""
+
+    def __init__(self, interval: float) -> None:
+        """Initialize the throttle."""
+        self.interval = interval
+        self._logged_at: dict[str, float] = {}
+        self._suppressed: dict[str, int] = {}
+
+    def should_log(self, key: str) -> int | None:
+        """Return the number of suppressed messages if this one should be logged, else None."""
+        now = time.monotonic()
+        logged_at = self._logged_at.get(key)
+        if logged_at is not None and now - logged_at < self.interval:
+            self._suppressed[key] = self._suppressed.get(key, 0) + 1
+            return None
+        self._logged_at[key] = now
+        return self._suppressed.pop(key, 0)
+
+    def reset(self, key: str) -> None:
+        """Log the next message with this key right away."""
+        self._logged_at.pop(key, None)
+        self._suppressed.pop(key, None)
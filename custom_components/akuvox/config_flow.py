@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from homeassistant import config_entries
+from homeassistant.components import webhook
 from homeassistant.helpers import selector
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
@@ -17,6 +18,14 @@ from .const import (
     LOCATIONS_DICT,
     COUNTRY_PHONE,
     SUBDOMAINS_LIST,
+    DEFAULT_POLL_INTERVAL_MIN,
+    DEFAULT_POLL_INTERVAL_MAX,
+    DEFAULT_POLL_OVERLAP_POLICY,
+    DEFAULT_DOOR_LOG_ROWS,
+    DEFAULT_DOOR_OPEN_COALESCE_WINDOW,
+    POLL_OVERLAP_OVERLAP,
+    POLL_OVERLAP_SKIP,
+    POLL_OVERLAP_WAIT,
 )
 from .helpers import AkuvoxHelpers
 
@@ -39,18 +48,12 @@ class AkuvoxFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         """Step 0: User selects sign-in method."""
 
         # Initialize the API client
+        # A new entry gets its own client, never another entry's
         if self.akuvox_api_client is None:
-            coordinator: AkuvoxDataUpdateCoordinator = None # type: ignore
-            if DOMAIN in self.hass.data:
-                for _key, value in self.hass.data[DOMAIN].items():
-                    coordinator = value
-            if coordinator:
-                self.akuvox_api_client = coordinator.client
-            else:
-                self.akuvox_api_client = AkuvoxApiClient(
-                    session=async_get_clientsession(self.hass),
-                    hass=self.hass,
-                    entry=None)
+            self.akuvox_api_client = AkuvoxApiClient(
+                session=async_get_clientsession(self.hass),
+                hass=self.hass,
+                entry=None)
 
 
         return self.async_show_menu(
@@ -399,6 +402,12 @@ class AkuvoxOptionsFlowHandler(config_entries.OptionsFlow):
             "wait": "Wait for camera screenshot URLs to become available before triggering the event (typically adds a delay of 0-3 seconds)."
         }
 
+        poll_overlap_policies = {
+            POLL_OVERLAP_SKIP: "Skip a poll while the previous one is still in flight.",
+            POLL_OVERLAP_OVERLAP: "Start another staggered poll while the previous one is still in flight.",
+            POLL_OVERLAP_WAIT: "Poll as soon as the previous poll completes.",
+        }
+
         default_country_name_code = helpers.find_country_name_code(config_data.get('country_code', self.hass.config.country))
         default_country_name = LOCATIONS_DICT.get(default_country_name_code, {}).get("country") # type: ignore
         default_subdomain = LOCATIONS_DICT.get(default_country_name_code, {}).get("subdomain") # type: ignore
@@ -438,6 +447,27 @@ class AkuvoxOptionsFlowHandler(config_entries.OptionsFlow):
             vol.Required("event_screenshot_options",
                          default=self.get_data_key_value("event_screenshot_options", "asap") # type: ignore
             ): vol.In(event_screenshot_options),
+            vol.Optional("adaptive_polling",
+                         default=self.get_data_key_value("adaptive_polling", False) # type: ignore
+            ): bool,
+            vol.Optional("poll_interval_min",
+                         default=self.get_data_key_value("poll_interval_min", DEFAULT_POLL_INTERVAL_MIN) # type: ignore
+            ): vol.All(vol.Coerce(float), vol.Range(min=0.5, max=300)),
+            vol.Optional("poll_interval_max",
+                         default=self.get_data_key_value("poll_interval_max", DEFAULT_POLL_INTERVAL_MAX) # type: ignore
+            ): vol.All(vol.Coerce(float), vol.Range(min=0.5, max=300)),
+            vol.Optional("poll_overlap_policy",
+                         default=self.get_data_key_value("poll_overlap_policy", DEFAULT_POLL_OVERLAP_POLICY) # type: ignore
+            ): vol.In(poll_overlap_policies),
+            vol.Optional("door_log_rows",
+                         default=self.get_data_key_value("door_log_rows", DEFAULT_DOOR_LOG_ROWS) # type: ignore
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=50)),
+            vol.Optional("door_open_coalesce_window",
+                         default=self.get_data_key_value("door_open_coalesce_window", DEFAULT_DOOR_OPEN_COALESCE_WINDOW) # type: ignore
+            ): vol.All(vol.Coerce(float), vol.Range(min=0, max=10)),
+            vol.Optional("local_relays",
+                         default=self.get_data_key_value("local_relays", "") # type: ignore
+            ): str,
         })
 
         # Show the form with the current options
@@ -445,7 +475,7 @@ class AkuvoxOptionsFlowHandler(config_entries.OptionsFlow):
             return self.async_show_form(
                 step_id="init",
                 data_schema=options_schema,
-                description_placeholders=user_input,
+                description_placeholders=self.get_description_placeholders(),
                 last_step=True
             )
 
@@ -453,9 +483,7 @@ class AkuvoxOptionsFlowHandler(config_entries.OptionsFlow):
 
         # API client
         if self.akuvox_api_client is None:
-            coordinator: AkuvoxDataUpdateCoordinator
-            for _key, value in self.hass.data[DOMAIN].items():
-                coordinator = value
+            coordinator: AkuvoxDataUpdateCoordinator = self.hass.data[DOMAIN][self.config_entry.entry_id]
             self.akuvox_api_client = coordinator.client
             self.akuvox_api_client._data.subdomain = current_subdomain # type: ignore
             self.akuvox_api_client._data.host = self.get_data_key_value("host") # type: ignore
@@ -526,6 +554,7 @@ class AkuvoxOptionsFlowHandler(config_entries.OptionsFlow):
             return self.async_show_form(
                 step_id="init",
                 data_schema=vol.Schema(data_schema),
+                description_placeholders=self.get_description_placeholders(),
                 errors=errors
             )
 
@@ -537,6 +566,14 @@ class AkuvoxOptionsFlowHandler(config_entries.OptionsFlow):
             title="",
         )
 
+    def get_description_placeholders(self) -> dict:
+        """Placeholders of the options form description."""
+        coordinator: AkuvoxDataUpdateCoordinator | None = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id)
+        webhook_id = coordinator.client.local_push_webhook_id if coordinator else None
+        return {
+            "action_url": webhook.async_generate_path(webhook_id) if webhook_id else "-",
+        }
+
     def get_data_key_value(self, key, placeholder=None):
         """Get the value for a given key. Options flow 1st, Config flow 2nd."""
         dicts = [dict(self.config_entry.options), dict(self.config_entry.data)]
@@ -0,0 +1,130 @@
+"""Persistent connection pool for the Akuvox cloud API."""
+from __future__ import annotations
+
+import asyncio
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+
+import aiohttp
+
+from .const import (
+    LOGGER,
+    CONNECTION_POOL_DNS_TTL,
+    CONNECTION_POOL_KEEPALIVE,
+    CONNECTION_POOL_LIMIT_PER_HOST,
+    CONNECTION_POOL_PREWARM_TIMEOUT,
+)
+
+
+class AkuvoxConnectionPool:
+    """Keep-alive connection pool for an account's regional Akuvox hosts.
+
+    Home Assistant's client session helper always uses the shared
+    connector, which cannot be tuned per account. The pool therefore owns
+    its session, and closes it on entry unload or Home Assistant shutdown.
+    """
+
+    hass: HomeAssistant
+    session: aiohttp.ClientSession
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the connector, DNS cache and connection statistics."""
+        self.hass = hass
+        self._stats: dict = {
+            "handshakes": 0,
+            "reused": 0,
+            "dns_cache_hits": 0,
+            "dns_cache_misses": 0,
+            "prewarmed_hosts": [],
+        }
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(self._async_on_connection_created)
+        trace_config.on_connection_reuseconn.append(self._async_on_connection_reused)
+        trace_config.on_dns_cache_hit.append(self._async_on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(self._async_on_dns_cache_miss)
+
+        self._connector = aiohttp.TCPConnector(
+            ttl_dns_cache=CONNECTION_POOL_DNS_TTL,
+            keepalive_timeout=CONNECTION_POOL_KEEPALIVE,
+            limit_per_host=CONNECTION_POOL_LIMIT_PER_HOST)
+        self.session = aiohttp.ClientSession(
+            connector=self._connector,
+            trace_configs=[trace_config])
+        self._cancel_close_listener = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_CLOSE, self._async_close_on_shutdown)
+
+    async def async_prewarm(self, hosts: list[str]) -> None:
+        """Open a pooled connection to each host ahead of the first real request."""
+        hosts = [host for host in dict.fromkeys(hosts) if host]
+        results = await asyncio.gather(
+            *[self._async_prewarm_host(host) for host in hosts])
+        self._stats["prewarmed_hosts"] = [
+            host for host, success in zip(hosts, results) if success]
+        LOGGER.debug("🔥 Pre-warmed connections to %s of %s Akuvox host%s",
+                     str(len(self._stats["prewarmed_hosts"])),
+                     str(len(hosts)),
+                     "" if len(hosts) == 1 else "s")
+
+    async def _async_prewarm_host(self, host: str) -> bool:
+        """Resolve the host and complete the TCP/TLS handshake."""
+        try:
+            async with self.session.head(
+                f"https://{host}/",
+                timeout=aiohttp.ClientTimeout(total=CONNECTION_POOL_PREWARM_TIMEOUT),
+                allow_redirects=False) as response:
+                await response.read()
+            return True
+        except Exception as error:  # pylint: disable=broad-except
+            LOGGER.debug("Unable to pre-warm connection to %s: %s", host, str(error))
+        return False
+
+    async def async_close(self) -> None:
+        """Close all pooled connections."""
+        if self._cancel_close_listener is not None:
+            self._cancel_close_listener()
+            self._cancel_close_listener = None
+        if not self.session.closed:
+            await self.session.close()
+
+    @callback
+    def _async_close_on_shutdown(self, _event: Event) -> None:
+        """Close the pooled connections when Home Assistant shuts down."""
+        self._cancel_close_listener = None
+        self.hass.async_create_task(self.async_close())
+
+    def get_stats(self) -> dict:
+        """Return connection pool statistics."""
+        return {
+            **self._get_connection_counts(),
+            **self._stats,
+        }
+
+    def _get_connection_counts(self) -> dict:
+        """Count open and idle connections, if this aiohttp version allows it.
+
+        aiohttp does not expose its pool publicly, so its private containers
+        are read. They are missing or shaped differently in some versions.
+        """
+        try:
+            # pylint: disable=protected-access
+            idle = sum(len(conns) for conns in self._connector._conns.values())  # type: ignore
+            in_use = len(self._connector._acquired)  # type: ignore
+        except (AttributeError, TypeError):
+            return {"open": None, "idle": None}
+        return {"open": idle + in_use, "idle": idle}
+
+    ###################
+
+    async def _async_on_connection_created(self, _session, _context, _params):
+        self._stats["handshakes"] += 1
+
+    async def _async_on_connection_reused(self, _session, _context, _params):
+        self._stats["reused"] += 1
+
+    async def _async_on_dns_cache_hit(self, _session, _context, _params):
+        self._stats["dns_cache_hits"] += 1
+
+    async def _async_on_dns_cache_miss(self, _session, _context, _params):
+        self._stats["dns_cache_misses"] += 1
@@ -469,11 +469,141 @@ API_OPENDOOR = "opendoor"
 
 API_APP_HOST = "subdomain.akuvox.com/web-server/v3/app/"
 API_GET_PERSONAL_TEMP_KEY_LIST = "tempKey/getPersonalTempKeyList?row=20&page=1"
-API_GET_PERSONAL_DOOR_LOG = "log/getDoorLog?row=1"
+API_GET_PERSONAL_DOOR_LOG = "log/getDoorLog"
 
 TEMP_KEY_QR_HOST = "subdomain.akuvox.com"
 
+# Device and configuration data (cold)
 DATA_STORAGE_KEY = "akuvox_data_storage_key"
+DATA_STORAGE_VERSION = 2
+# Door log cursor and other runtime state (hot)
+STATE_STORAGE_KEY = "akuvox_state_storage_key"
+STATE_STORAGE_VERSION = 1
+STATE_STORAGE_KEYS = ["latest_door_log", "wait_for_image_url", "app_type"]
+# Seconds to batch runtime state changes before writing them to storage
+DATA_STORAGE_SAVE_DELAY = 10
 
 CAPTURE_TIME_KEY = "CaptureTime"
+CAPTURE_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 PIC_URL_KEY = "PicUrl"
+
+CONNECTION_POOL_DNS_TTL = 300
+CONNECTION_POOL_KEEPALIVE = 75
+CONNECTION_POOL_LIMIT_PER_HOST = 4
+CONNECTION_POOL_PREWARM_TIMEOUT = 5
+
+DATA_RESPONSE_CACHES = f"{DOMAIN}_response_caches"
+
+# Seconds for which responses of rarely changing endpoints are cached
+RESPONSE_CACHE_TTL: dict = {
+    API_REST_SERVER_DATA: 24 * 60 * 60,
+    API_SERVERS_LIST: 60 * 60,
+    API_USERCONF: 10 * 60,
+    API_GET_PERSONAL_TEMP_KEY_LIST: 5 * 60,
+}
+
+APP_TYPE_COMMUNITY = "community"
+APP_TYPE_SINGLE = "single"
+APP_TYPE_STORAGE_KEY = "app_type"
+# Seconds between scheduled revalidations of the account's app type
+APP_TYPE_REVALIDATE_INTERVAL = 24 * 60 * 60
+# Consecutive empty/failed door log polls that trigger an early revalidation
+APP_TYPE_REVALIDATE_AFTER_MISSES = 5
+# Minimum seconds between two revalidations of the account's app type
+APP_TYPE_MIN_REVALIDATE_INTERVAL = 10 * 60
+
+# Door log polling intervals (seconds)
+DEFAULT_POLL_INTERVAL = 2
+DEFAULT_POLL_INTERVAL_MIN = 2
+DEFAULT_POLL_INTERVAL_MAX = 20
+# Seconds to keep polling at the fastest rate after door activity
+ADAPTIVE_POLL_HOLD = 60
+# Factor by which the adaptive polling interval grows on each idle poll
+ADAPTIVE_POLL_DECAY = 1.5
+
+# What the door log poller does when a deadline arrives while polls are in flight:
+# "overlap" starts another staggered poll (up to POLL_MAX_IN_FLIGHT concurrent),
+# "skip" drops the deadline and "wait" fires as soon as the poll in flight ends.
+# Overlapping polls multiply the request rate against a slow cloud, so they are opt-in.
+POLL_OVERLAP_OVERLAP = "overlap"
+POLL_OVERLAP_SKIP = "skip"
+POLL_OVERLAP_WAIT = "wait"
+POLL_OVERLAP_POLICIES = [POLL_OVERLAP_OVERLAP, POLL_OVERLAP_SKIP, POLL_OVERLAP_WAIT]
+DEFAULT_POLL_OVERLAP_POLICY = POLL_OVERLAP_SKIP
+POLL_MAX_IN_FLIGHT = 3
+
+# Door log catch-up: number of the most recent entries fetched on each poll
+DEFAULT_DOOR_LOG_ROWS = 10
+DOOR_LOG_EVENT = "akuvox_door_update"
+REPLAYED_KEY = "Replayed"
+
+# Door event dedupe window
+DOOR_EVENT_DEDUPE_KEYS = ("MAC", "Relay", CAPTURE_TIME_KEY, "Initiator", "CaptureType")
+DOOR_EVENT_DEDUPE_SIZE = 256
+
+# Wait mode: door events held back until their screenshot URL is available
+PENDING_SCREENSHOT_TIMEOUT = 30
+PENDING_SCREENSHOT_POLL_INTERVAL = 1
+
+# Shared door log poll scheduler
+DATA_POLL_SCHEDULER = f"{DOMAIN}_poll_scheduler"
+POLL_SCHEDULER_MAX_CONCURRENT = 4
+POLL_WATCHDOG_BACKOFF_MIN = 1
+POLL_WATCHDOG_BACKOFF_MAX = 300
+
+# Per-endpoint circuit breakers
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_HALF_OPEN = "half_open"
+CIRCUIT_OPEN = "open"
+CIRCUIT_STATES = [CIRCUIT_CLOSED, CIRCUIT_HALF_OPEN, CIRCUIT_OPEN]
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_BACKOFF_MIN = 4
+CIRCUIT_BACKOFF_MAX = 600
+CIRCUIT_PROBE_TIMEOUT = 30
+CIRCUIT_FAILURE_STATUSES = [401, 403, 429]
+ERROR_LOG_INTERVAL = 300
+
+# Request scheduling: priority classes, most urgent first
+REQUEST_PRIORITY_INTERACTIVE = 0
+REQUEST_PRIORITY_POLLING = 1
+REQUEST_PRIORITY_BACKGROUND = 2
+REQUEST_PRIORITIES = ["interactive", "polling", "background"]
+REQUEST_RATE = 5
+REQUEST_RATE_BURST = 10
+REQUEST_MAX_CONCURRENT = 4
+# Seconds a request may take once the scheduler granted it a slot
+REQUEST_TIMEOUT = 10
+
+# Door open confirmation
+DOOR_OPEN_CONFIRMED_EVENT = "akuvox_door_open_confirmed"
+DOOR_OPEN_TIMEOUT_EVENT = "akuvox_door_open_timeout"
+DOOR_OPEN_CONFIRM_TIMEOUT = 20
+DOOR_OPEN_BURST_INTERVAL = 1
+# Seconds a door log entry may be captured before the press it confirms, for clock skew
+DOOR_OPEN_CAPTURE_SLACK = 5
+
+# Presses of the same relay within this many seconds share one door open request
+DEFAULT_DOOR_OPEN_COALESCE_WINDOW = 1.0
+
+# Services
+SERVICE_OPEN_DOORS = "open_doors"
+OPEN_DOORS_MAX_CONCURRENT = 4
+
+# Local LAN door open, through the device's HTTP API
+LOCAL_OPENDOOR_PATH = "fcgi/do?action=OpenDoor&DoorNum={door_num}"
+LOCAL_OPENDOOR_TIMEOUT = 1.5
+DOOR_OPEN_PATH_LOCAL = "local"
+DOOR_OPEN_PATH_CLOUD = "cloud"
+
+# Local push of door events through the device's Action URL
+LOCAL_PUSH_WEBHOOK_NAME = f"{NAME} Action URL"
+LOCAL_PUSH_WEBHOOK_ID_KEY = "local_push_webhook_id"
+DOOR_SCREENSHOT_EVENT = "akuvox_door_screenshot"
+LOCAL_PUSH_MATCH_WINDOW = 60
+LOCAL_PUSH_REPEAT_WINDOW = 2
+# Seconds between a push and the capture time of a cloud entry of the same door event
+LOCAL_PUSH_CAPTURE_WINDOW = 30
+LOCAL_PUSH_DEFAULT_EVENT = "Action URL"
+SOURCE_KEY = "Source"
+SOURCE_LOCAL = "local"
+SOURCE_CLOUD = "cloud"
@@ -1,10 +1,11 @@
 """DataUpdateCoordinator for akuvox."""
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers import storage
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
@@ -20,10 +21,18 @@ from .api import (
 from .const import(
     DOMAIN,
     LOGGER,
-    DATA_STORAGE_KEY
 )
 
 
+def freeze_device_data(data):
+    """Return a read-only copy of the device data, to be shared between platforms."""
+    if isinstance(data, Mapping):
+        return MappingProxyType({key: freeze_device_data(value) for key, value in data.items()})
+    if isinstance(data, list | tuple):
+        return tuple(freeze_device_data(value) for value in data)
+    return data
+
+
 # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
 class AkuvoxDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the API."""
@@ -45,17 +54,29 @@ class AkuvoxDataUpdateCoordinator(DataUpdateCoordinator):
         )
 
     async def _async_update_data(self):
-        """Update data via library."""
+        """Update data via library.
+
+        The parsed device data is published as an immutable snapshot in
+        coordinator.data, which all platforms read during setup.
+        """
         try:
             if await self.client.async_retrieve_user_data():
                 data: dict = self.client.get_devices_json()
                 if data is not None:
                     LOGGER.debug("Saving user's data to local storage")
-                    store = storage.Store(self.hass, 1, DATA_STORAGE_KEY)
-                    await store.async_save(data)
+                    await self.client.async_save_devices_json(data)
+                    return freeze_device_data(data)
 
         except AkuvoxApiClientAuthenticationError as exception:
             raise ConfigEntryAuthFailed(exception) from exception
         except AkuvoxApiClientError as exception:
             raise UpdateFailed(exception) from exception
+        return self.data
 
+    async def async_get_device_data(self):
+        """Device data snapshot, falling back to local storage on a cold start."""
+        if self.data is None:
+            LOGGER.debug("No device data received yet, using local storage")
+            stored_data = await self.client.async_load_devices_json()
+            return freeze_device_data(stored_data) if stored_data else None
+        return self.data
@@ -4,17 +4,26 @@ from __future__ import annotations
 
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.helpers import storage
 
 from .const import (
     LOGGER,
     TEMP_KEY_QR_HOST,
     PIC_URL_KEY,
     CAPTURE_TIME_KEY,
-    DATA_STORAGE_KEY,
+    REPLAYED_KEY,
+    DATA_STORAGE_SAVE_DELAY,
     LOCATIONS_DICT,
+    DEFAULT_POLL_INTERVAL_MIN,
+    DEFAULT_POLL_INTERVAL_MAX,
+    DEFAULT_POLL_OVERLAP_POLICY,
+    DEFAULT_DOOR_LOG_ROWS,
+    DEFAULT_DOOR_OPEN_COALESCE_WINDOW,
 )
+from .dedupe import AkuvoxDoorEventDedupe
 from .helpers import AkuvoxHelpers
+from .local_push import AkuvoxLocalPushes
+from .pending_screenshots import AkuvoxPendingScreenshots
+from .store import get_device_store, get_state_store
 
 helpers = AkuvoxHelpers()
 
@@ -31,6 +40,12 @@ class AkuvoxData:
     token: str = ""
     phone_number: str = ""
     wait_for_image_url: bool = False
+    adaptive_polling: bool = False
+    poll_interval_min: float = DEFAULT_POLL_INTERVAL_MIN
+    poll_interval_max: float = DEFAULT_POLL_INTERVAL_MAX
+    poll_overlap_policy: str = DEFAULT_POLL_OVERLAP_POLICY
+    door_log_rows: int = DEFAULT_DOOR_LOG_ROWS
+    door_open_coalesce_window: float = DEFAULT_DOOR_OPEN_COALESCE_WINDOW
     rtsp_ip: str = ""
     project_name: str = ""
     camera_data = []
@@ -51,6 +66,18 @@ class AkuvoxData:
         """Initialize the Akuvox API client."""
 
         self.hass = hass if hass else self.hass
+        # Clients of the config flow have no entry: they keep their state in memory
+        self._device_store = get_device_store(self.hass, entry.entry_id) if entry else None
+        self._state_store = get_state_store(self.hass, entry.entry_id) if entry else None
+        self._stored_data: dict | None = None
+        self.latest_door_log: dict | None = None
+        # Set until the first door log poll after a (re)start has been parsed
+        self._door_log_replay: bool = True
+        self.door_event_dedupe = AkuvoxDoorEventDedupe()
+        self.pending_screenshots = AkuvoxPendingScreenshots()
+        self.local_pushes = AkuvoxLocalPushes()
+        # MAC -> base URL of the device's HTTP API on the LAN
+        self.local_relays: dict[str, str] = {}
         self.host = host if host else self.get_value_for_key(entry, "host", host) # type: ignore
         self.auth_token = auth_token if auth_token else self.get_value_for_key(entry, "auth_token", self.host) # type: ignore
         self.token = token if token else self.get_value_for_key(entry, "token", self.token) # type: ignore
@@ -72,7 +99,9 @@ class AkuvoxData:
         if subdomain is None:
             self.subdomain = "ecloud"
 
-        self.hass.add_job(self.async_set_stored_data_for_key, "wait_for_image_url", self.wait_for_image_url)
+        # Only entries persist state: config flow clients must not touch an entry's storage
+        if entry is not None:
+            self.hass.add_job(self.async_set_stored_data_for_key, "wait_for_image_url", self.wait_for_image_url)
 
     def get_value_for_key(self, entry: ConfigEntry, key: str, default):
         """Get the value for a given key. 1st check: configured, 2nd check: options, 3rd check: data."""
@@ -186,55 +215,163 @@ class AkuvoxData:
                              str(len(door_keys_data["doors"])),
                              "" if len(door_keys_data["doors"]) == 1 else "s")
 
-    async def async_parse_personal_door_log(self, json_data: list):
-        """Parse the getDoorLog API response."""
-        ret_value = None
-        is_wait = await self.async_get_stored_data_for_key("wait_for_image_url")
-        if json_data is not None and len(json_data) > 0:
-            new_door_log = json_data[0]
-            latest_door_log = await self.async_get_stored_data_for_key("latest_door_log")
-            if latest_door_log is not None and CAPTURE_TIME_KEY in latest_door_log:
-                if new_door_log is not None and CAPTURE_TIME_KEY in new_door_log:
-                    # Ignore previous door open event
-                    if str(latest_door_log[CAPTURE_TIME_KEY]) == str(new_door_log[CAPTURE_TIME_KEY]):
-                        return None
-                    # Screenshot required and currently unavailable
-                    if PIC_URL_KEY in new_door_log and new_door_log[PIC_URL_KEY] == "":
-                        if is_wait is True:
-                            LOGGER.debug("New door entry detected --> Waiting for screenshot URL...")
-                            return None
-                        else:
-                            LOGGER.debug("New door entry detected --> Not waiting for the screenshot URL...")
-                    # New door event detected
-                    LOGGER.debug("ℹ️ New personal door log entry detected:")
-                    LOGGER.debug(" - Initiator: %s", new_door_log["Initiator"])
-                    LOGGER.debug(" - CaptureType: %s", new_door_log["CaptureType"])
-                    LOGGER.debug(" - Location: %s", new_door_log["Location"])
-                    LOGGER.debug(" - Door MAC: %s", new_door_log["MAC"])
-                    LOGGER.debug(" - Door Relay: %s", new_door_log["Relay"])
-                    LOGGER.debug(" - Camera screenshot URL: %s", new_door_log["PicUrl"])
-                    ret_value = new_door_log
-
-            await self.async_set_stored_data_for_key("latest_door_log", new_door_log)
-        return ret_value
+    async def async_parse_personal_door_log(self, json_data: list) -> list[dict]:
+        """Parse the getDoorLog API response.
+
+        The response lists the most recent entries, newest first. Returns the
+        door events that are ready to be fired in chronological order, and
+        advances the cursor past the new entries, up to the oldest held back
+        entry. In wait mode, entries still missing their screenshot URL are
+        held back in the pending table, as are entries of door events already
+        pushed by the device on the LAN.
+        """
+        new_door_logs = []
+        if json_data is None or len(json_data) == 0:
+            return new_door_logs
+
+        latest_door_log = await self.async_get_latest_door_log()
+        if latest_door_log is None or CAPTURE_TIME_KEY not in latest_door_log:
+            # First run: start tracking from the newest entry
+            self._door_log_replay = False
+            await self._async_set_latest_door_log(json_data[0])
+            return new_door_logs
+
+        latest_key = self.door_event_dedupe.get_key(latest_door_log)
+        resolved_door_logs = []
+        reached_cursor = False
+        for door_log in json_data:
+            if door_log is None or CAPTURE_TIME_KEY not in door_log:
+                continue
+            key = self.door_event_dedupe.get_key(door_log)
+            # Reached the previously seen door open event
+            if key == latest_key:
+                reached_cursor = True
+            # Pending entries are released once their screenshot URL shows up
+            if key in self.pending_screenshots:
+                if door_log.get(PIC_URL_KEY, "") != "":
+                    resolved_door_logs.append(self.pending_screenshots.resolve(key, door_log))
+                continue
+            if reached_cursor:
+                continue
+            # Ignore older entries coming back in the window
+            if self.door_event_dedupe.contains(door_log):
+                continue
+            new_door_logs.append(door_log)
+        if not reached_cursor and len(new_door_logs) > 0:
+            LOGGER.debug("⚠️ Door log cursor not found in the last %s entries",
+                         str(len(json_data)))
+        new_door_logs.reverse()
+
+        # Entries recovered by the first poll after a restart are replays
+        replayed = self._door_log_replay
+        self._door_log_replay = False
+        ready_door_logs = resolved_door_logs
+        for new_door_log in new_door_logs:
+            new_door_log = {**new_door_log, REPLAYED_KEY: replayed}
+            # Screenshot required and currently unavailable
+            if PIC_URL_KEY in new_door_log and new_door_log[PIC_URL_KEY] == "":
+                # Events already fired by a local push only wait for their screenshot
+                if self.wait_for_image_url is True or self.local_pushes.find(new_door_log) is not None:
+                    LOGGER.debug("New door entry detected --> Waiting for screenshot URL...")
+                    self.pending_screenshots.add(self.door_event_dedupe.get_key(new_door_log),
+                                                 new_door_log)
+                    continue
+                LOGGER.debug("New door entry detected --> Not waiting for the screenshot URL...")
+            ready_door_logs.append(new_door_log)
+
+        for ready_door_log in ready_door_logs:
+            LOGGER.debug("ℹ️ New personal door log entry detected:")
+            LOGGER.debug(" - Initiator: %s", ready_door_log["Initiator"])
+            LOGGER.debug(" - CaptureType: %s", ready_door_log["CaptureType"])
+            LOGGER.debug(" - Location: %s", ready_door_log["Location"])
+            LOGGER.debug(" - Door MAC: %s", ready_door_log["MAC"])
+            LOGGER.debug(" - Door Relay: %s", ready_door_log["Relay"])
+            LOGGER.debug(" - Camera screenshot URL: %s", ready_door_log["PicUrl"])
+            self.door_event_dedupe.add(ready_door_log)
+
+        if (cursor_door_log := self._get_cursor_door_log(json_data)) is not None:
+            await self._async_set_latest_door_log(cursor_door_log)
+        return ready_door_logs
+
+    def _get_cursor_door_log(self, json_data: list) -> dict | None:
+        """Return the entry the cursor may move to: the newest one not after a held back entry.
+
+        Pending entries live in memory only. Keeping the persisted cursor
+        before them makes them detected again after a restart. Returns
+        None when the cursor must stay where it is.
+        """
+        cursor_door_log = None
+        for door_log in reversed(json_data):
+            if door_log is None or CAPTURE_TIME_KEY not in door_log:
+                continue
+            if self.door_event_dedupe.get_key(door_log) in self.pending_screenshots:
+                break
+            cursor_door_log = door_log
+        return cursor_door_log
+
+    def pop_expired_door_logs(self) -> list[dict]:
+        """Return the pending door events whose screenshot URL never arrived."""
+        expired_door_logs = self.pending_screenshots.pop_expired()
+        for expired_door_log in expired_door_logs:
+            self.door_event_dedupe.add(expired_door_log)
+        return expired_door_logs
+
+    async def _async_set_latest_door_log(self, door_log: dict):
+        """Move the door log cursor to the given entry."""
+        door_log = {key: value for key, value in door_log.items() if key != REPLAYED_KEY}
+        self.latest_door_log = door_log
+        await self.async_set_stored_data_for_key("latest_door_log", door_log)
+
+    async def async_get_latest_door_log(self) -> dict | None:
+        """Return the door log cursor: the latest entry seen, loaded from storage once."""
+        if self.latest_door_log is None:
+            self.latest_door_log = await self.async_get_stored_data_for_key("latest_door_log")
+        return self.latest_door_log
 
     ###################
 
+    async def _async_load_stored_data(self) -> dict:
+        """Load the runtime state into memory on first access."""
+        if self._stored_data is None:
+            if self._state_store is not None:
+                self._stored_data = await self._state_store.async_load()
+            if self._stored_data is None:
+                self._stored_data = {}
+        return self._stored_data
+
     async def async_set_stored_data_for_key(self, key, value):
-        """Store key/value pair to integration's storage."""
-        store = storage.Store(self.hass, 1, DATA_STORAGE_KEY)
-        stored_data: dict = await store.async_load() # type: ignore
-        if stored_data is None:
-            stored_data = {}
+        """Store key/value pair to integration's runtime state storage.
+
+        The value is kept in memory and written to disk in a batch, after
+        DATA_STORAGE_SAVE_DELAY seconds.
+        """
+        stored_data = await self._async_load_stored_data()
+        if key in stored_data and stored_data[key] == value:
+            return
         stored_data[key] = value
-        await store.async_save(stored_data)
+        if self._state_store is not None:
+            self._state_store.async_delay_save_if_changed(stored_data, DATA_STORAGE_SAVE_DELAY)
+
+    async def async_flush_stored_data(self):
+        """Write the runtime state to disk now, before a reload or restart reads it back."""
+        if self._state_store is not None and self._stored_data is not None:
+            await self._state_store.async_flush(self._stored_data)
 
     async def async_get_stored_data_for_key(self, key):
-        """Store key/value pair to integration's storage."""
-        store = storage.Store(self.hass, 1, DATA_STORAGE_KEY)
-        stored_data: dict = await store.async_load() # type: ignore
-        if stored_data:
-            return stored_data.get(key, None)
+        """Get the value stored for a key in the integration's runtime state storage."""
+        stored_data = await self._async_load_stored_data()
+        return stored_data.get(key, None)
+
+    async def async_save_device_data(self, device_data: dict):
+        """Write the device data to the integration's device storage, if changed."""
+        if self._device_store is not None:
+            await self._device_store.async_save(device_data)
+
+    async def async_load_device_data(self) -> dict | None:
+        """Read the device data from the integration's device storage."""
+        if self._device_store is None:
+            return None
+        return await self._device_store.async_load()
 
     ###################
 
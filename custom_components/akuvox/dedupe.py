@@ -0,0 +1,55 @@
+"""Bounded deduplication window for door log events."""
+from __future__ import annotations
+
+from collections import OrderedDict
+
+from .const import DOOR_EVENT_DEDUPE_KEYS, DOOR_EVENT_DEDUPE_SIZE
+
+
+class AkuvoxDoorEventDedupe:
+    """LRU-bounded set of door log events that were already seen.
+
+    Events are identified by their MAC, relay, capture time, initiator and
+    capture type, so two relays triggered within the same second are told
+    apart. Lookups are O(1) and the oldest keys are evicted once the window
+    is full.
+    """
+
+    def __init__(self, max_size: int = DOOR_EVENT_DEDUPE_SIZE) -> None:
+        """Initialize the dedupe window and its counters."""
+        self.max_size = max(1, max_size)
+        self._keys: OrderedDict[tuple, None] = OrderedDict()
+        self.duplicates: int = 0
+        self.evictions: int = 0
+
+    @staticmethod
+    def get_key(door_log: dict) -> tuple:
+        """Return the composite key identifying a door log entry."""
+        return tuple(str(door_log.get(key, "")) for key in DOOR_EVENT_DEDUPE_KEYS)
+
+    def contains(self, door_log: dict) -> bool:
+        """Return True if the entry was already seen, refreshing its recency."""
+        key = self.get_key(door_log)
+        if key in self._keys:
+            self._keys.move_to_end(key)
+            self.duplicates += 1
+            return True
+        return False
+
+    def add(self, door_log: dict) -> None:
+        """Remember an entry, evicting the least recently seen one when full."""
+        key = self.get_key(door_log)
+        self._keys[key] = None
+        self._keys.move_to_end(key)
+        while len(self._keys) > self.max_size:
+            self._keys.popitem(last=False)
+            self.evictions += 1
+
+    def get_stats(self) -> dict:
+        """Return dedupe window statistics."""
+        return {
+            "size": len(self._keys),
+            "max_size": self.max_size,
+            "duplicates": self.duplicates,
+            "evictions": self.evictions,
+        }
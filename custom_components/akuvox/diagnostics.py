@@ -0,0 +1,26 @@
+"""Diagnostics support for akuvox."""
+from __future__ import annotations
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import AkuvoxDataUpdateCoordinator
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict:
+    """Return diagnostics for a config entry."""
+    coordinator: AkuvoxDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    client = coordinator.client
+    return {
+        "connection_pool": client.connection_pool.get_stats() if client.connection_pool else None,
+        "single_flight": client.get_request_stats(),
+        "request_scheduler": client.get_request_scheduler_stats(),
+        "response_cache": client.get_response_cache_stats(),
+        "endpoints": client.get_endpoint_stats(),
+        "circuit_breakers": client.get_circuit_breaker_stats(),
+        "door_log": client.get_door_log_stats(),
+        "door_open": client.get_door_open_stats(),
+        "local_push": client.get_local_push_stats(),
+        "poll_scheduler": client.poll_scheduler.get_stats() if client.poll_scheduler else None,
+    }
@@ -0,0 +1,246 @@
+"""Door open requests and their outcome."""
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import asdict, dataclass, field, replace
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CAPTURE_TIME_FORMAT,
+    CAPTURE_TIME_KEY,
+    DOOR_OPEN_CAPTURE_SLACK,
+    DOOR_OPEN_PATH_CLOUD,
+    DOOR_OPEN_PATH_LOCAL,
+    LOCAL_OPENDOOR_PATH,
+)
+
+
+def normalize_mac(mac: str) -> str:
+    """Return a MAC address in upper case without separators."""
+    return "".join(char for char in str(mac) if char.isalnum()).upper()
+
+
+def parse_capture_time(door_log: dict) -> datetime | None:
+    """Return the capture time of a door log entry, or None if it cannot be parsed."""
+    try:
+        return datetime.strptime(str(door_log.get(CAPTURE_TIME_KEY, "")), CAPTURE_TIME_FORMAT)
+    except ValueError:
+        return None
+
+
+def parse_local_relays(value: str) -> dict[str, str]:
+    """Parse "MAC=base URL" pairs, separated by commas or new lines, into a dict."""
+    local_relays = {}
+    for pair in str(value).replace("\n", ",").split(","):
+        mac, _, base_url = pair.partition("=")
+        if mac.strip() and base_url.strip():
+            local_relays[normalize_mac(mac)] = base_url.strip().rstrip("/")
+    return local_relays
+
+
+def redact_credentials(text: str) -> str:
+    """Replace the user:password@ part of any URL in the text."""
+    return re.sub(r"//[^/@\s]+@", "//***@", text)
+
+
+def get_local_opendoor_url(base_url: str, relay_id: str) -> str:
+    """Return the URL of a device's LAN API that opens a relay.
+
+    The device numbers its doors from 1, the cloud numbers relays from 0.
+    """
+    return f"{base_url}/" + LOCAL_OPENDOOR_PATH.format(door_num=int(relay_id) + 1)
+
+
+@dataclass
+class AkuvoxDoorOpenResult:
+    """Outcome of a door open request."""
+
+    success: bool
+    latency: float
+    name: str = ""
+    error: str | None = None
+    response: Any = None
+    requested_at: datetime = field(default_factory=dt_util.utcnow)
+    # Shared with an identical request instead of reaching the cloud
+    coalesced: bool = False
+    # Whether the request was served by the device on the LAN or by the cloud
+    path: str = DOOR_OPEN_PATH_CLOUD
+
+    def as_dict(self) -> dict:
+        """Return the result as a dictionary of JSON serializable values."""
+        result = asdict(self)
+        result.pop("response")
+        result["latency"] = round(self.latency, 3)
+        result["requested_at"] = self.requested_at.isoformat()
+        return result
+
+
+class AkuvoxDoorOpenStats:
+    """Round trip statistics of an account's door open requests."""
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.requests: int = 0
+        self.failures: int = 0
+        self.total_latency: float = 0.0
+        self.max_latency: float = 0.0
+        self.paths: dict[str, int] = {DOOR_OPEN_PATH_LOCAL: 0, DOOR_OPEN_PATH_CLOUD: 0}
+        self.local_fallbacks: int = 0
+        self.last_result: AkuvoxDoorOpenResult | None = None
+
+    def record(self, result: AkuvoxDoorOpenResult) -> None:
+        """Record the outcome of a door open request."""
+        self.requests += 1
+        if not result.success:
+            self.failures += 1
+        self.paths[result.path] += 1
+        self.total_latency += result.latency
+        self.max_latency = max(self.max_latency, result.latency)
+        self.last_result = result
+
+    def get_stats(self) -> dict:
+        """Return door open request statistics."""
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "average_latency": round(self.total_latency / self.requests, 3) if self.requests else None,
+            "max_latency": round(self.max_latency, 3),
+            "paths": dict(self.paths),
+            "local_fallbacks": self.local_fallbacks,
+            "last_result": self.last_result.as_dict() if self.last_result else None,
+        }
+
+
+class AkuvoxDoorOpenCoalescer:
+    """Share one door open request between rapid presses of the same relay.
+
+    Presses arriving while a relay's request is in flight, or within the
+    coalescing window after it succeeded, get that request's result instead
+    of sending another request to the cloud.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the coalescer and its counters."""
+        self._requests: dict[Hashable, asyncio.Future] = {}
+        self._completed_at: dict[Hashable, float] = {}
+        self.presses: int = 0
+        self.coalesced: int = 0
+
+    async def async_do(self,
+                       key: Hashable,
+                       func: Callable[[], Awaitable[AkuvoxDoorOpenResult]],
+                       window: float) -> AkuvoxDoorOpenResult:
+        """Run func for the relay, or share the result of its recent request."""
+        self.presses += 1
+        future = self._requests.get(key)
+        if future is not None:
+            completed_at = self._completed_at.get(key)
+            if not future.done() or (completed_at is not None
+                                     and time.monotonic() - completed_at <= window):
+                self.coalesced += 1
+                return replace(await asyncio.shield(future), coalesced=True)
+
+        future = asyncio.ensure_future(func())
+        self._requests[key] = future
+        self._completed_at.pop(key, None)
+        try:
+            result = await asyncio.shield(future)
+        except BaseException:
+            self._requests.pop(key, None)
+            raise
+        if result.success and window > 0:
+            # Linger so that presses within the window share this result
+            self._completed_at[key] = time.monotonic()
+        else:
+            self._requests.pop(key, None)
+        return result
+
+    def get_stats(self) -> dict:
+        """Return door open coalescing statistics."""
+        return {
+            "presses": self.presses,
+            "coalesced": self.coalesced,
+        }
+
+
+@dataclass
+class AkuvoxPendingDoorOpen:
+    """Door open request waiting for its door log entry."""
+
+    name: str
+    mac: str
+    relay: str
+    requested_at: float
+    # Local wall clock time, comparable with the capture time of door log entries
+    pressed_at: datetime
+    cancel_timeout: Callable[[], None] | None = None
+
+
+class AkuvoxDoorOpenConfirmations:
+    """Correlate door open requests with the door log entries they cause.
+
+    An entry confirms a request for its door and relay when it was captured
+    after the press, give or take capture_slack seconds of clock skew.
+    """
+
+    def __init__(self, capture_slack: float = DOOR_OPEN_CAPTURE_SLACK) -> None:
+        """Initialize the table and its counters."""
+        self.capture_slack = capture_slack
+        self._pending: list[AkuvoxPendingDoorOpen] = []
+        self.confirmed: int = 0
+        self.timed_out: int = 0
+        self.total_latency: float = 0.0
+        self.max_latency: float = 0.0
+
+    def add(self, pending: AkuvoxPendingDoorOpen) -> None:
+        """Wait for the door log entry of a door open request."""
+        self._pending.append(pending)
+
+    def match(self, door_log: dict) -> tuple[AkuvoxPendingDoorOpen, float] | None:
+        """Return the oldest request for the entry's door and relay, with its latency."""
+        mac = normalize_mac(door_log.get("MAC", ""))
+        relay = str(door_log.get("Relay", ""))
+        if (capture_time := parse_capture_time(door_log)) is None:
+            return None
+        for pending in self._pending:
+            # Entries captured before the press, e.g. caught up or held back ones, are not its outcome
+            if normalize_mac(pending.mac) == mac and pending.relay == relay \
+                    and capture_time >= pending.pressed_at - timedelta(seconds=self.capture_slack):
+                self._pending.remove(pending)
+                latency = time.monotonic() - pending.requested_at
+                self.confirmed += 1
+                self.total_latency += latency
+                self.max_latency = max(self.max_latency, latency)
+                return pending, latency
+        return None
+
+    def expire(self, pending: AkuvoxPendingDoorOpen) -> bool:
+        """Give up on a request. Returns False if it was confirmed meanwhile."""
+        if pending not in self._pending:
+            return False
+        self._pending.remove(pending)
+        self.timed_out += 1
+        return True
+
+    def clear(self) -> None:
+        """Drop all pending requests and their timeouts."""
+        for pending in self._pending:
+            if pending.cancel_timeout is not None:
+                pending.cancel_timeout()
+        self._pending.clear()
+
+    def get_stats(self) -> dict:
+        """Return door open confirmation statistics."""
+        return {
+            "pending": len(self._pending),
+            "confirmed": self.confirmed,
+            "timed_out": self.timed_out,
+            "average_latency": round(self.total_latency / self.confirmed, 3) if self.confirmed else None,
+            "max_latency": round(self.max_latency, 3),
+        }
@@ -2,45 +2,244 @@
 
 import asyncio
 import logging
+import time
 from homeassistant.core import HomeAssistant
 
+import async_timeout
+
+from .const import (
+    DEFAULT_POLL_INTERVAL,
+    DEFAULT_POLL_INTERVAL_MIN,
+    DEFAULT_POLL_INTERVAL_MAX,
+    ADAPTIVE_POLL_HOLD,
+    ADAPTIVE_POLL_DECAY,
+    DEFAULT_POLL_OVERLAP_POLICY,
+    POLL_OVERLAP_POLICIES,
+    POLL_OVERLAP_SKIP,
+    POLL_OVERLAP_WAIT,
+    POLL_MAX_IN_FLIGHT,
+    POLL_WATCHDOG_BACKOFF_MIN,
+    POLL_WATCHDOG_BACKOFF_MAX,
+)
+
 LOGGER = logging.getLogger(__name__)
 
 class DoorLogPoller:
-    """Poller for the personal door log API."""
+    """Poller for the personal door log API.
+
+    Polls are fired on fixed deadlines of the event loop clock, so the
+    period does not stretch by the request's round trip time. When a
+    deadline arrives while polls are still in flight, the overlap policy
+    decides whether to start another staggered poll, skip the deadline or
+    wait for the poll in flight.
+
+    In adaptive mode the interval drops to interval_min whenever there is
+    door activity (a new door event, a call or a relay press), is held there
+    for ADAPTIVE_POLL_HOLD seconds and then decays towards interval_max.
+    """
 
     hass: HomeAssistant
     async_retrieve_personal_door_log = None
-    interval: int = 2
+    interval: float = DEFAULT_POLL_INTERVAL
     is_polling: bool = False
 
     def __init__(self,
                  hass: HomeAssistant,
                  poll_function,
-                 interval=2):
+                 interval=DEFAULT_POLL_INTERVAL,
+                 adaptive: bool = False,
+                 interval_min: float = DEFAULT_POLL_INTERVAL_MIN,
+                 interval_max: float = DEFAULT_POLL_INTERVAL_MAX,
+                 overlap_policy: str = DEFAULT_POLL_OVERLAP_POLICY,
+                 max_in_flight: int = POLL_MAX_IN_FLIGHT):
         """Initialize the poller for tghe personal door log API."""
         self.hass = hass
         self.async_retrieve_personal_door_log = poll_function
         self.interval = interval
+        self.adaptive = False
+        self.interval_min = interval_min
+        self.interval_max = interval_max
+        self.overlap_policy = DEFAULT_POLL_OVERLAP_POLICY
+        self.max_in_flight = max(1, max_in_flight)
+        self._fixed_interval = interval
+        self._last_activity: float = time.monotonic()
+        self._in_flight: set[asyncio.Task] = set()
+        self._wakeup = asyncio.Event()
+        self._stats: dict = {
+            "polls": 0,
+            "skipped": 0,
+            "missed_deadlines": 0,
+            "max_concurrent": 0,
+            "errors": 0,
+            "restarts": 0,
+        }
         self._task = None
+        self._restart_backoff: float = POLL_WATCHDOG_BACKOFF_MIN
+        self._restart_handle: asyncio.TimerHandle | None = None
+        self._burst_interval: float | None = None
+        self._burst_until: float = 0.0
+        self.configure(adaptive, interval_min, interval_max, overlap_policy)
+
+    def configure(self,
+                  adaptive: bool,
+                  interval_min: float,
+                  interval_max: float,
+                  overlap_policy: str | None = None):
+        """Update the adaptive polling and overlap configuration."""
+        self.adaptive = bool(adaptive)
+        self.interval_min = max(0.5, float(interval_min))
+        self.interval_max = max(self.interval_min, float(interval_max))
+        self.interval = self.interval_min if self.adaptive else self._fixed_interval
+        if overlap_policy in POLL_OVERLAP_POLICIES:
+            self.overlap_policy = overlap_policy
+
+    def notify_activity(self):
+        """Poll at the fastest rate following door activity."""
+        self._last_activity = time.monotonic()
+        if self.adaptive:
+            self.interval = self.interval_min
+            # Bring forward a deadline scheduled at the slower rate
+            self._wakeup.set()
+
+    def burst(self, duration: float, interval: float):
+        """Poll at the given interval for a while, e.g. to confirm a door open."""
+        self._burst_interval = interval
+        self._burst_until = time.monotonic() + duration
+        self._wakeup.set()
+
+    def get_interval(self) -> float:
+        """Return the interval until the next poll."""
+        if self._burst_interval is not None and time.monotonic() < self._burst_until:
+            return min(self.interval, self._burst_interval)
+        return self.interval
+
+    def _update_interval(self):
+        """Decay the polling rate while the door log is idle."""
+        if not self.adaptive:
+            return
+        if time.monotonic() - self._last_activity < ADAPTIVE_POLL_HOLD:
+            self.interval = self.interval_min
+        else:
+            self.interval = min(self.interval_max, self.interval * ADAPTIVE_POLL_DECAY)
+
+    def get_stats(self) -> dict:
+        """Return polling statistics."""
+        return {
+            **self._stats,
+            "interval": self.get_interval(),
+            "overlap_policy": self.overlap_policy,
+            "in_flight": len(self._in_flight),
+        }
 
     async def async_start(self):
         """Start polling the personal door log."""
         if self.async_retrieve_personal_door_log:
             if not self.is_polling:
-                LOGGER.debug("🔄 Polling user's personal door log every %s second%s.",
-                             str(self.interval),
-                             "" if self.interval == 0 else "s")
+                if self.adaptive:
+                    LOGGER.debug("🔄 Polling user's personal door log every %s-%s seconds.",
+                                 str(self.interval_min),
+                                 str(self.interval_max))
+                else:
+                    LOGGER.debug("🔄 Polling user's personal door log every %s second%s.",
+                                 str(self.interval),
+                                 "" if self.interval == 1 else "s")
                 self.is_polling = True
-                self._task = asyncio.create_task(
-                    self.async_retrieve_personal_door_log()) # type: ignore
+                self._start_loop()
+
+    def _start_loop(self):
+        """Start the poll loop under the watchdog."""
+        self._restart_handle = None
+        if self.is_polling:
+            self._task = asyncio.create_task(self._async_poll_loop())
+            self._task.add_done_callback(self._on_loop_done)
+
+    def _on_loop_done(self, task: asyncio.Task):
+        """Watchdog: restart a poll loop that died while polling, with backoff."""
+        if not self.is_polling or task.cancelled():
+            return
+        delay = self._restart_backoff
+        self._restart_backoff = min(POLL_WATCHDOG_BACKOFF_MAX, delay * 2)
+        self._stats["restarts"] += 1
+        LOGGER.warning("⚠️ Door log poll loop stopped unexpectedly (%s). Restarting in %s seconds.",
+                       str(task.exception()),
+                       str(delay))
+        self._restart_handle = asyncio.get_running_loop().call_later(delay, self._start_loop)
+
+    async def _async_poll_loop(self):
+        """Fire polls on fixed deadlines until stopped."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        while self.is_polling:
+            await self._async_fire_poll()
+
+            interval = self.get_interval()
+            fired_at = deadline
+            deadline += interval
+            now = loop.time()
+            if deadline < now:
+                # Deadlines were missed: realign to the schedule instead of bursting
+                missed = int((now - deadline) // interval) + 1
+                self._stats["missed_deadlines"] += missed
+                deadline += missed * interval
+
+            self._wakeup.clear()
+            try:
+                async with async_timeout.timeout(deadline - now):
+                    await self._wakeup.wait()
+                # Door activity: fire at the (now faster) interval after the last poll
+                deadline = max(loop.time(), min(deadline, fired_at + self.get_interval()))
+                await asyncio.sleep(deadline - loop.time())
+            except asyncio.TimeoutError:
+                pass
+
+    async def _async_fire_poll(self):
+        """Start a poll at the current deadline, honouring the overlap policy."""
+        if self._in_flight:
+            if self.overlap_policy == POLL_OVERLAP_SKIP:
+                self._stats["skipped"] += 1
+                return
+            if self.overlap_policy == POLL_OVERLAP_WAIT:
+                await asyncio.wait(self._in_flight)
+            elif len(self._in_flight) >= self.max_in_flight:
+                self._stats["skipped"] += 1
+                return
+
+        self._stats["polls"] += 1
+        task = asyncio.create_task(self._async_poll())
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+        self._stats["max_concurrent"] = max(self._stats["max_concurrent"], len(self._in_flight))
+
+    async def _async_poll(self):
+        """Run a single poll and adapt the interval to its outcome."""
+        try:
+            new_activity = await self.async_retrieve_personal_door_log() # type: ignore
+        except Exception as error:  # pylint: disable=broad-except
+            self._stats["errors"] += 1
+            LOGGER.debug("Door log poll failed: %s", str(error))
+            new_activity = False
+        else:
+            # The loop is healthy again: reset the watchdog's backoff
+            self._restart_backoff = POLL_WATCHDOG_BACKOFF_MIN
+        if new_activity:
+            self.notify_activity()
+        else:
+            self._update_interval()
 
     async def async_stop(self):
         """Stop polling the personal door log."""
+        if self._restart_handle is not None:
+            self._restart_handle.cancel()
+            self._restart_handle = None
         if self.is_polling and self._task:
             LOGGER.debug("🛑 Stop polling personal door log")
             self.is_polling = False
             self._task.cancel()
+            for task in list(self._in_flight):
+                task.cancel()
+            if self._task.done():
+                # Died earlier and was waiting for the watchdog to restart it
+                return
             try:
                 await self._task
             except asyncio.CancelledError:
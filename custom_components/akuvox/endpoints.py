@@ -0,0 +1,161 @@
+"""Precompiled URL and header templates for the Akuvox API endpoints."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from collections.abc import Mapping
+
+from .const import (
+    API_APP_HOST,
+    API_GET_PERSONAL_DOOR_LOG,
+    API_GET_PERSONAL_TEMP_KEY_LIST,
+    API_OPENDOOR,
+    API_USERCONF,
+    OPENDOOR_API_VERSION,
+    USERCONF_API_VERSION,
+)
+
+APP_USER_AGENT = "VBell/6.61.2 (iPhone; iOS 16.6; Scale/3.00)"
+APP_ACCEPT_LANGUAGE = "en-AU;q=1, he-AU;q=0.9, ru-RU;q=0.8"
+WEB_ACCEPT_LANGUAGE = "en-AU,en;q=0.9"
+APP_HOST_URL = "https://" + API_APP_HOST.replace("subdomain.", "{subdomain}.") + "{app_type}/"
+
+
+@dataclass(frozen=True)
+class AkuvoxEndpoint:
+    """URL and header templates of an Akuvox API endpoint.
+
+    Templates may reference {host}, {subdomain}, {app_type} and {token},
+    plus any endpoint specific parameters passed to the registry.
+    """
+
+    name: str
+    url: str
+    headers: tuple[tuple[str, str], ...]
+
+
+@dataclass(frozen=True)
+class AkuvoxRenderedEndpoint:
+    """Endpoint URL and headers rendered for one account context."""
+
+    url: str
+    headers: Mapping[str, str]
+
+
+ENDPOINT_USERCONF = AkuvoxEndpoint(
+    name=API_USERCONF,
+    url="https://{host}/" + API_USERCONF + "?token={token}",
+    headers=(
+        ("Host", "{host}"),
+        ("X-AUTH-TOKEN", "{token}"),
+        ("Connection", "keep-alive"),
+        ("api-version", USERCONF_API_VERSION),
+        ("Accept", "*/*"),
+        ("User-Agent", APP_USER_AGENT),
+        ("Accept-Language", APP_ACCEPT_LANGUAGE),
+        ("x-cloud-lang", "en"),
+    ))
+
+ENDPOINT_OPENDOOR = AkuvoxEndpoint(
+    name=API_OPENDOOR,
+    url="https://{host}/" + API_OPENDOOR + "?token={token}",
+    headers=(
+        ("Host", "{host}"),
+        ("Content-Type", "application/x-www-form-urlencoded"),
+        ("X-AUTH-TOKEN", "{token}"),
+        ("api-version", OPENDOOR_API_VERSION),
+        ("Accept-Encoding", "gzip, deflate"),
+        ("Connection", "keep-alive"),
+        ("Accept", "*/*"),
+        ("User-Agent", APP_USER_AGENT),
+        ("Accept-Language", APP_ACCEPT_LANGUAGE),
+        ("x-cloud-lang", "en"),
+    ))
+
+ENDPOINT_PERSONAL_TEMP_KEY_LIST = AkuvoxEndpoint(
+    name=API_GET_PERSONAL_TEMP_KEY_LIST,
+    url=APP_HOST_URL + API_GET_PERSONAL_TEMP_KEY_LIST,
+    headers=(
+        ("x-cloud-version", "6.4"),
+        ("accept", "application/json, text/plain, */*"),
+        ("sec-fetch-site", "same-origin"),
+        ("accept-language", WEB_ACCEPT_LANGUAGE),
+        ("sec-fetch-mode", "cors"),
+        ("x-cloud-lang", "en"),
+        ("user-agent", "Mozilla/5.0 (iPhone; CPU iPhone OS 16_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) SmartPlus/6.2"),
+        ("referer", "https://{subdomain}.akuvox.com/smartplus/TmpKey.html?TOKEN={token}&USERTYPE=20&VERSION=6.6"),
+        ("x-auth-token", "{token}"),
+        ("sec-fetch-dest", "empty"),
+    ))
+
+ENDPOINT_PERSONAL_DOOR_LOG = AkuvoxEndpoint(
+    name=API_GET_PERSONAL_DOOR_LOG,
+    url=APP_HOST_URL + API_GET_PERSONAL_DOOR_LOG + "?row={rows}",
+    headers=(
+        ("x-cloud-version", "6.4"),
+        ("accept", "application/json, text/plain, */*"),
+        ("sec-fetch-site", "same-origin"),
+        ("accept-language", WEB_ACCEPT_LANGUAGE),
+        ("sec-fetch-mode", "cors"),
+        ("x-cloud-lang", "en"),
+        ("user-agent", "Mozilla/5.0 (iPhone; CPU iPhone OS 17_0_2 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) SmartPlus/6.2"),
+        ("referer", "https://{subdomain}.akuvox.com/smartplus/Activities.html?TOKEN={token}"),
+        ("x-auth-token", "{token}"),
+        ("sec-fetch-dest", "empty"),
+    ))
+
+
+class AkuvoxEndpointRegistry:
+    """Per-account cache of rendered endpoint URLs and headers.
+
+    Rendered endpoints are reused until the account context they were
+    rendered for (host, subdomain, app type or token) changes.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the registry."""
+        self._rendered: dict[tuple, AkuvoxRenderedEndpoint] = {}
+        self.renders: int = 0
+        self.reuses: int = 0
+
+    def get(self,
+            endpoint: AkuvoxEndpoint,
+            host: str,
+            subdomain: str,
+            app_type: str,
+            token: str,
+            **params) -> AkuvoxRenderedEndpoint:
+        """Return the endpoint rendered for the given account context."""
+        key = (endpoint.name, host, subdomain, app_type, token, *params.items())
+        rendered = self._rendered.get(key)
+        if rendered is not None:
+            self.reuses += 1
+            return rendered
+
+        # Drop renderings of the endpoint for a previous account context
+        for stale_key in [k for k in self._rendered if k[0] == endpoint.name]:
+            del self._rendered[stale_key]
+
+        context = {
+            "host": host,
+            "subdomain": subdomain,
+            "app_type": app_type,
+            "token": token,
+            **params,
+        }
+        rendered = AkuvoxRenderedEndpoint(
+            url=endpoint.url.format(**context),
+            headers=MappingProxyType({
+                name: value.format(**context) for name, value in endpoint.headers
+            }))
+        self._rendered[key] = rendered
+        self.renders += 1
+        return rendered
+
+    def get_stats(self) -> dict:
+        """Return endpoint rendering statistics."""
+        return {
+            "rendered": len(self._rendered),
+            "renders": self.renders,
+            "reuses": self.reuses,
+        }
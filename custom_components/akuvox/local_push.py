@@ -0,0 +1,142 @@
+"""Door events pushed by the devices' Action URL callbacks on the LAN."""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+from aiohttp import web
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    LOCAL_PUSH_CAPTURE_WINDOW,
+    LOCAL_PUSH_MATCH_WINDOW,
+    LOCAL_PUSH_REPEAT_WINDOW,
+)
+from .door_open import normalize_mac, parse_capture_time
+
+if TYPE_CHECKING:
+    from .api import AkuvoxApiClient
+
+
+@dataclass
+class AkuvoxLocalPush:
+    """Door event pushed by a device, waiting for its cloud door log entry."""
+
+    mac: str
+    relay: str
+    event: str
+    door_log: dict
+    # Local wall clock time, comparable with the capture time of cloud entries
+    captured_at: datetime
+    received_at: float = field(default_factory=time.monotonic)
+
+
+class AkuvoxLocalPushes:
+    """Correlate pushed door events with the door log entries polled later.
+
+    A pushed event is fired as soon as it arrives. The cloud entry of the
+    same door event is then recognized by its door MAC, relay and event
+    type, and by a capture time close to the push, and only contributes
+    its screenshot URL. Cloud entries that match no push are fired as usual.
+    """
+
+    def __init__(self,
+                 match_window: float = LOCAL_PUSH_MATCH_WINDOW,
+                 repeat_window: float = LOCAL_PUSH_REPEAT_WINDOW,
+                 capture_window: float = LOCAL_PUSH_CAPTURE_WINDOW) -> None:
+        """Initialize the table and its counters."""
+        self.match_window = match_window
+        self.repeat_window = repeat_window
+        self.capture_window = capture_window
+        self._pushes: list[AkuvoxLocalPush] = []
+        self.pushed: int = 0
+        self.repeated: int = 0
+        self.matched: int = 0
+        self.unmatched: int = 0
+        self.total_lead: float = 0.0
+
+    def __len__(self) -> int:
+        """Return the number of pushed events waiting for their cloud entry."""
+        return len(self._pushes)
+
+    def add(self, push: AkuvoxLocalPush) -> bool:
+        """Track a pushed event. Returns False if it repeats a push just received."""
+        self._expire()
+        for other in self._pushes:
+            if (other.mac, other.relay, other.event) == (push.mac, push.relay, push.event) \
+                    and push.received_at - other.received_at < self.repeat_window:
+                self.repeated += 1
+                return False
+        self._pushes.append(push)
+        self.pushed += 1
+        return True
+
+    def find(self, door_log: dict) -> AkuvoxLocalPush | None:
+        """Return the oldest pushed event of the same door event as a door log entry."""
+        self._expire()
+        if (capture_time := parse_capture_time(door_log)) is None:
+            return None
+        mac = normalize_mac(door_log.get("MAC", ""))
+        relay = str(door_log.get("Relay", ""))
+        event = str(door_log.get("CaptureType", "")).lower()
+        for push in self._pushes:
+            # Pushes configured without a relay (e.g. calls) match any relay of the device
+            if push.mac == mac and push.relay in ("", relay) and push.event.lower() == event \
+                    and abs((capture_time - push.captured_at).total_seconds()) <= self.capture_window:
+                return push
+        return None
+
+    def pop(self, door_log: dict) -> AkuvoxLocalPush | None:
+        """Remove and return the pushed event of a door log entry, if any."""
+        if (push := self.find(door_log)) is not None:
+            self._pushes.remove(push)
+            self.matched += 1
+            self.total_lead += time.monotonic() - push.received_at
+        return push
+
+    def clear(self) -> None:
+        """Drop all pushed events."""
+        self._pushes.clear()
+
+    def _expire(self) -> None:
+        """Forget pushed events whose cloud entry never showed up."""
+        deadline = time.monotonic() - self.match_window
+        expired = [push for push in self._pushes if push.received_at < deadline]
+        for push in expired:
+            self._pushes.remove(push)
+        self.unmatched += len(expired)
+
+    def get_stats(self) -> dict:
+        """Return local push statistics."""
+        return {
+            "pending": len(self._pushes),
+            "pushed": self.pushed,
+            "repeated": self.repeated,
+            "matched_cloud": self.matched,
+            "unmatched_cloud": self.unmatched,
+            # How much earlier than the cloud poll the pushed events were fired
+            "average_lead": round(self.total_lead / self.matched, 3) if self.matched else None,
+        }
+
+
+async def async_handle_action_url(client: AkuvoxApiClient,
+                                  _hass: HomeAssistant,
+                                  _webhook_id: str,
+                                  request: web.Request) -> web.Response:
+    """Turn an Action URL callback of a device into a door event of the client's account.
+
+    Registered as the account's webhook: the random webhook ID is the
+    secret that authenticates the devices, and requests from outside the
+    local network are refused by the webhook component.
+    """
+    params = dict(request.query)
+    if request.method == "POST":
+        params.update({key: str(value) for key, value in (await request.post()).items()})
+    if not params.get("mac"):
+        return web.Response(status=HTTPStatus.BAD_REQUEST, text="Missing mac parameter")
+
+    client.async_handle_local_push(params)
+    return web.Response(status=HTTPStatus.OK)
@@ -0,0 +1,100 @@
+"""Door events waiting for their camera screenshot URL."""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+
+from .const import LOGGER, PENDING_SCREENSHOT_TIMEOUT
+
+
+@dataclass
+class AkuvoxPendingDoorEvent:
+    """Door log entry held back until its screenshot URL is available."""
+
+    door_log: dict
+    detected_at: float
+    deadline: float
+
+
+class AkuvoxPendingScreenshots:
+    """Table of door events waiting for a screenshot URL.
+
+    Several events can be pending at once, each with its own deadline.
+    Events are released either when a later door log response carries
+    their screenshot URL or, once the deadline passes, without an image.
+    """
+
+    def __init__(self, timeout: float = PENDING_SCREENSHOT_TIMEOUT) -> None:
+        """Initialize the table and its counters."""
+        self.timeout = timeout
+        self._pending: dict[tuple, AkuvoxPendingDoorEvent] = {}
+        self.resolved: int = 0
+        self.timed_out: int = 0
+        self.total_wait: float = 0.0
+        self.max_wait: float = 0.0
+
+    def __len__(self) -> int:
+        """Return the number of pending events."""
+        return len(self._pending)
+
+    def __contains__(self, key: tuple) -> bool:
+        """Return True if an event with the given key is pending."""
+        return key in self._pending
+
+    def add(self, key: tuple, door_log: dict) -> None:
+        """Hold back a door event until its screenshot URL is available."""
+        if key not in self._pending:
+            now = time.monotonic()
+            self._pending[key] = AkuvoxPendingDoorEvent(
+                door_log=door_log,
+                detected_at=now,
+                deadline=now + self.timeout)
+
+    def resolve(self, key: tuple, door_log: dict) -> dict | None:
+        """Release a pending event now that its screenshot URL arrived."""
+        if (pending := self._pending.pop(key, None)) is None:
+            return None
+        self.resolved += 1
+        self._record_wait(pending)
+        return {**pending.door_log, **door_log}
+
+    def pop_expired(self) -> list[dict]:
+        """Release the events whose deadline has passed, without an image."""
+        now = time.monotonic()
+        expired = [key for key, pending in self._pending.items() if pending.deadline <= now]
+        door_logs = []
+        for key in expired:
+            pending = self._pending.pop(key)
+            LOGGER.debug("⏱️ No screenshot URL after %s seconds --> Firing door event without it",
+                         str(self.timeout))
+            self.timed_out += 1
+            self._record_wait(pending)
+            door_logs.append(pending.door_log)
+        return door_logs
+
+    def get_next_deadline(self) -> float | None:
+        """Return the monotonic time of the earliest deadline, if any."""
+        if not self._pending:
+            return None
+        return min(pending.deadline for pending in self._pending.values())
+
+    def clear(self) -> None:
+        """Drop all pending events."""
+        self._pending.clear()
+
+    def _record_wait(self, pending: AkuvoxPendingDoorEvent) -> None:
+        """Record how long an event was held back."""
+        wait = time.monotonic() - pending.detected_at
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+    def get_stats(self) -> dict:
+        """Return pending screenshot statistics."""
+        released = self.resolved + self.timed_out
+        return {
+            "pending": len(self._pending),
+            "resolved": self.resolved,
+            "timed_out": self.timed_out,
+            "average_wait": round(self.total_wait / released, 3) if released else None,
+            "max_wait": round(self.max_wait, 3),
+        }
@@ -0,0 +1,143 @@
+"""Door log poll scheduler shared by all akuvox config entries."""
+from __future__ import annotations
+
+import asyncio
+import random
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import LOGGER, POLL_SCHEDULER_MAX_CONCURRENT
+from .door_poll import DoorLogPoller
+
+
+class AkuvoxPollScheduler:
+    """Registry and scheduler of the door log pollers of all accounts.
+
+    The registry guarantees exactly one poll loop per account, across
+    entry reloads: registering a new poller for an entry stops the one it
+    replaces, and entries pointing at the same account share one poller.
+    Only the first entry polls, and the next one takes over when it is
+    removed. The other entries route their door open confirmations and
+    pushed door events to the client of the polling entry.
+
+    Each poller is started after a random delay of up to one poll interval,
+    so pollers are spread out instead of firing together, and at most
+    max_concurrent polls run at once across all accounts.
+    """
+
+    def __init__(self,
+                 hass: HomeAssistant,
+                 max_concurrent: int = POLL_SCHEDULER_MAX_CONCURRENT) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self.max_concurrent = max(1, max_concurrent)
+        self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        # Account key -> entry IDs, the first of which polls for the account
+        self._accounts: dict[Any, list[str]] = {}
+        self._entry_accounts: dict[str, Any] = {}
+        self._pollers: dict[str, DoorLogPoller] = {}
+        self._clients: dict[str, Any] = {}
+        self._start_tasks: dict[str, asyncio.Task] = {}
+        self._running: int = 0
+        self._stats: dict = {
+            "polls": 0,
+            "throttled": 0,
+            "deduplicated": 0,
+            "replaced": 0,
+            "max_concurrent_polls": 0,
+        }
+
+    async def async_add(self,
+                        entry_id: str,
+                        account_key: Any,
+                        poller: DoorLogPoller,
+                        client: Any = None) -> bool:
+        """Register an entry's poller and API client, and schedule the poller's start.
+
+        Returns False when another entry already polls the same account.
+        """
+        if entry_id in self._entry_accounts:
+            if self._entry_accounts[entry_id] == account_key and self._pollers[entry_id] is poller:
+                return self.is_polling_entry(entry_id)
+            # The entry was reloaded or its account changed: stop the previous poller first
+            self._stats["replaced"] += 1
+            await self.async_remove(entry_id)
+        self._entry_accounts[entry_id] = account_key
+        self._pollers[entry_id] = poller
+        self._clients[entry_id] = client
+        entry_ids = self._accounts.setdefault(account_key, [])
+        entry_ids.append(entry_id)
+        if len(entry_ids) > 1:
+            LOGGER.debug("🔁 Door log of this account is already polled by another entry")
+            self._stats["deduplicated"] += 1
+            return False
+        self._schedule_start(entry_id)
+        return True
+
+    async def async_remove(self, entry_id: str) -> None:
+        """Stop an entry's poller, handing its account over to the next entry if any."""
+        if (task := self._start_tasks.pop(entry_id, None)) is not None:
+            task.cancel()
+        if (poller := self._pollers.pop(entry_id, None)) is not None:
+            await poller.async_stop()
+        self._clients.pop(entry_id, None)
+        if (account_key := self._entry_accounts.pop(entry_id, None)) is None:
+            return
+        entry_ids = self._accounts.get(account_key, [])
+        was_polling = len(entry_ids) > 0 and entry_ids[0] == entry_id
+        if entry_id in entry_ids:
+            entry_ids.remove(entry_id)
+        if len(entry_ids) == 0:
+            self._accounts.pop(account_key, None)
+        elif was_polling:
+            self._schedule_start(entry_ids[0])
+
+    def is_polling_entry(self, entry_id: str) -> bool:
+        """Return True if the entry is the one polling for its account."""
+        account_key = self._entry_accounts.get(entry_id)
+        entry_ids = self._accounts.get(account_key, [])
+        return len(entry_ids) > 0 and entry_ids[0] == entry_id
+
+    def get_polling_client(self, entry_id: str) -> Any | None:
+        """Return the API client of the entry polling for the entry's account."""
+        entry_ids = self._accounts.get(self._entry_accounts.get(entry_id), [])
+        return self._clients.get(entry_ids[0]) if entry_ids else None
+
+    def _schedule_start(self, entry_id: str) -> None:
+        """Start an entry's poller after a random delay."""
+        poller = self._pollers[entry_id]
+        delay = random.uniform(0, max(0.0, poller.interval))
+
+        async def async_start():
+            await asyncio.sleep(delay)
+            self._start_tasks.pop(entry_id, None)
+            await poller.async_start()
+
+        self._start_tasks[entry_id] = self.hass.async_create_task(async_start())
+
+    async def async_run(self, poll_function: Callable[[], Awaitable[Any]]) -> Any:
+        """Run a poll once a slot is available."""
+        if self._semaphore.locked():
+            self._stats["throttled"] += 1
+        async with self._semaphore:
+            self._running += 1
+            self._stats["polls"] += 1
+            self._stats["max_concurrent_polls"] = max(self._stats["max_concurrent_polls"],
+                                                      self._running)
+            try:
+                return await poll_function()
+            finally:
+                self._running -= 1
+
+    def get_stats(self) -> dict:
+        """Return poll scheduler statistics."""
+        return {
+            **self._stats,
+            "accounts": len(self._accounts),
+            "entries": len(self._entry_accounts),
+            "running": self._running,
+            "max_concurrent": self.max_concurrent,
+            "restarts": sum(poller.get_stats()["restarts"] for poller in self._pollers.values()),
+        }
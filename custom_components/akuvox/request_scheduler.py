@@ -0,0 +1,142 @@
+"""Priority request scheduler for an Akuvox account."""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from .const import (
+    REQUEST_PRIORITIES,
+    REQUEST_PRIORITY_INTERACTIVE,
+    REQUEST_RATE,
+    REQUEST_RATE_BURST,
+    REQUEST_MAX_CONCURRENT,
+)
+
+
+class AkuvoxRequestScheduler:
+    """Schedule an account's API requests by priority class.
+
+    Requests wait for a free slot (at most max_concurrent in flight) and a
+    token of a token bucket refilled at rate tokens per second, which keeps
+    the account under the cloud's rate limits. Waiting requests are served
+    strictly by priority class (polling, then background) and in arrival
+    order within a class.
+
+    Interactive requests, such as door opens, never wait: they skip the
+    concurrency cap and take a token only if one is available, so they are
+    not delayed by the requests in flight.
+    """
+
+    def __init__(self,
+                 rate: float = REQUEST_RATE,
+                 burst: int = REQUEST_RATE_BURST,
+                 max_concurrent: int = REQUEST_MAX_CONCURRENT) -> None:
+        """Initialize the scheduler."""
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.max_concurrent = max(1, max_concurrent)
+        self._tokens: float = float(self.burst)
+        self._refilled_at: float = time.monotonic()
+        self._running: int = 0
+        self._interactive_running: int = 0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._dispatch_handle: asyncio.TimerHandle | None = None
+        self._stats: dict[str, dict] = {
+            name: {"requests": 0, "queued": 0, "total_wait": 0.0, "max_wait": 0.0}
+            for name in REQUEST_PRIORITIES
+        }
+
+    async def async_run(self, priority: int, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Run a request once the scheduler grants it a slot."""
+        if priority == REQUEST_PRIORITY_INTERACTIVE:
+            self._stats[REQUEST_PRIORITIES[priority]]["requests"] += 1
+            # Leave fewer tokens to the other requests, without waiting for one
+            self._take_token()
+            self._interactive_running += 1
+            try:
+                return await func()
+            finally:
+                self._interactive_running -= 1
+        await self._async_acquire(priority)
+        try:
+            return await func()
+        finally:
+            self._running -= 1
+            self._dispatch()
+
+    async def _async_acquire(self, priority: int) -> None:
+        """Wait for a slot and a rate limit token."""
+        enqueued_at = time.monotonic()
+        stats = self._stats[REQUEST_PRIORITIES[priority]]
+        stats["requests"] += 1
+        if not self._waiters and self._running < self.max_concurrent and self._take_token():
+            self._running += 1
+            return
+
+        stats["queued"] += 1
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted a slot just before being cancelled: hand it on
+                self._running -= 1
+                self._dispatch()
+            raise
+        wait = time.monotonic() - enqueued_at
+        stats["total_wait"] += wait
+        stats["max_wait"] = max(stats["max_wait"], wait)
+
+    def _take_token(self) -> bool:
+        """Take a token from the bucket, if one is available."""
+        now = time.monotonic()
+        self._tokens = min(float(self.burst), self._tokens + (now - self._refilled_at) * self.rate)
+        self._refilled_at = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+    def _dispatch(self) -> None:
+        """Grant slots to the highest priority waiters."""
+        if self._dispatch_handle is not None:
+            self._dispatch_handle.cancel()
+            self._dispatch_handle = None
+        while self._waiters and self._running < self.max_concurrent:
+            if self._waiters[0][2].done():
+                # Cancelled while waiting
+                heapq.heappop(self._waiters)
+                continue
+            if not self._take_token():
+                # Retry once the bucket holds a token again
+                delay = (1 - self._tokens) / self.rate
+                self._dispatch_handle = asyncio.get_running_loop().call_later(delay, self._dispatch)
+                return
+            _priority, _sequence, future = heapq.heappop(self._waiters)
+            self._running += 1
+            future.set_result(None)
+
+    def get_stats(self) -> dict:
+        """Return queue wait statistics per priority class."""
+        return {
+            "running": self._running,
+            "interactive_running": self._interactive_running,
+            "waiting": len(self._waiters),
+            "tokens": round(self._tokens, 2),
+            **{
+                name: {
+                    "requests": stats["requests"],
+                    "queued": stats["queued"],
+                    "average_wait": round(stats["total_wait"] / stats["requests"], 4) if stats["requests"] else None,
+                    "max_wait": round(stats["max_wait"], 4),
+                }
+                for name, stats in self._stats.items()
+            },
+        }
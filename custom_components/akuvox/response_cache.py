@@ -0,0 +1,85 @@
+"""TTL response cache for rarely changing Akuvox API endpoints."""
+from __future__ import annotations
+
+import time
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Any
+
+from .const import LOGGER
+
+
+@dataclass
+class AkuvoxCachedResponse:
+    """Cached, already processed API response."""
+
+    value: Any
+    expires_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+class AkuvoxResponseCache:
+    """Response cache with a per-endpoint TTL and conditional revalidation."""
+
+    def __init__(self) -> None:
+        """Initialize the cache and its counters."""
+        self._entries: dict[Hashable, AkuvoxCachedResponse] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+        self.revalidated: int = 0
+        self.invalidations: int = 0
+
+    def get_fresh(self, key: Hashable) -> Any | None:
+        """Return the cached value if it has not expired yet."""
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at > time.monotonic():
+            self.hits += 1
+            return entry.value
+        self.misses += 1
+        return None
+
+    def get_conditional_headers(self, key: Hashable) -> dict:
+        """Return validator headers for revalidating an expired entry with the server."""
+        headers = {}
+        if (entry := self._entries.get(key)) is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def revalidate(self, key: Hashable, ttl: float) -> Any | None:
+        """Extend an entry's lifetime after a "304 Not Modified" response."""
+        if (entry := self._entries.get(key)) is None:
+            return None
+        self.revalidated += 1
+        entry.expires_at = time.monotonic() + ttl
+        return entry.value
+
+    def store(self, key: Hashable, value: Any, ttl: float, response_headers) -> None:
+        """Cache a processed response along with its validators."""
+        self._entries[key] = AkuvoxCachedResponse(
+            value=value,
+            expires_at=time.monotonic() + ttl,
+            etag=response_headers.get("ETag"),
+            last_modified=response_headers.get("Last-Modified"))
+
+    def invalidate(self) -> None:
+        """Drop all cached responses."""
+        if self._entries:
+            LOGGER.debug("🧹 Clearing %s cached API response%s",
+                         str(len(self._entries)),
+                         "" if len(self._entries) == 1 else "s")
+            self.invalidations += 1
+            self._entries.clear()
+
+    def get_stats(self) -> dict:
+        """Return response cache statistics."""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+            "invalidations": self.invalidations,
+        }
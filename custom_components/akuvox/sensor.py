@@ -1,29 +1,28 @@
 """Sensor platform for akuvox."""
 from datetime import datetime
-from homeassistant.components.sensor import SensorEntity
-from homeassistant.helpers import storage
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
+from homeassistant.const import UnitOfTime
+from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 
 from .api import AkuvoxApiClient
 from .coordinator import AkuvoxDataUpdateCoordinator
 from .const import (
     DOMAIN,
     LOGGER,
+    CIRCUIT_STATES,
     NAME,
     VERSION,
-    DATA_STORAGE_KEY
 )
 from .entity import AkuvoxEntity
 
 async def async_setup_entry(hass, entry, async_add_devices):
     """Set up the temporary door key platform."""
-    coordinator: AkuvoxDataUpdateCoordinator
-    for _key, value in hass.data[DOMAIN].items():
-        coordinator = value
+    coordinator: AkuvoxDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
     client = coordinator.client
-    store = storage.Store(hass, 1, DATA_STORAGE_KEY)
-    device_data: dict = await store.async_load() # type: ignore
-    door_keys_data = device_data["door_keys_data"]
+    device_data = await coordinator.async_get_device_data()
+    if not device_data:
+        LOGGER.error("No device data found")
+    door_keys_data = device_data["door_keys_data"] if device_data else []
     date_format = "%d-%m-%Y %H:%M:%S"
 
     entities = []
@@ -52,6 +51,9 @@ async def async_setup_entry(hass, entry, async_add_devices):
             )
         )
 
+    entities.append(AkuvoxPollIntervalSensor(client=client, entry=entry))
+    entities.append(AkuvoxCircuitStateSensor(client=client, entry=entry))
+
     async_add_devices(entities)
 
 class AkuvoxTemporaryDoorKey(SensorEntity, AkuvoxEntity):
@@ -121,3 +123,63 @@ class AkuvoxTemporaryDoorKey(SensorEntity, AkuvoxEntity):
             'qr_code_url': self.qr_code_url,
             'expired': not self.is_key_active()
         }
+
+
+class AkuvoxPollIntervalSensor(SensorEntity):
+    """Diagnostic sensor reporting the current door log polling interval."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_icon = "mdi:timer-sync-outline"
+
+    def __init__(self, client: AkuvoxApiClient, entry) -> None:
+        """Initialize the polling interval sensor."""
+        super().__init__()
+        self.client = client
+        self._attr_unique_id = f"{entry.entry_id}_door_log_poll_interval"
+        self._attr_name = "Door log poll interval"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},  # type: ignore
+            name=entry.title,
+            model=VERSION,
+            manufacturer=NAME,
+        )
+
+    @property
+    def native_value(self):
+        """Current door log polling interval in seconds."""
+        interval = self.client.get_poll_interval()
+        return round(interval, 1) if interval is not None else None
+
+
+class AkuvoxCircuitStateSensor(SensorEntity):
+    """Diagnostic sensor reporting the state of the API circuit breakers."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_options = CIRCUIT_STATES
+    _attr_icon = "mdi:electric-switch"
+
+    def __init__(self, client: AkuvoxApiClient, entry) -> None:
+        """Initialize the circuit state sensor."""
+        super().__init__()
+        self.client = client
+        self._attr_unique_id = f"{entry.entry_id}_api_circuit_state"
+        self._attr_name = "API circuit state"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},  # type: ignore
+            name=entry.title,
+            model=VERSION,
+            manufacturer=NAME,
+        )
+
+    @property
+    def native_value(self):
+        """Worst circuit state across the API endpoints."""
+        return self.client.get_circuit_state()
+
+    @property
+    def extra_state_attributes(self):
+        """Circuit breaker state of each API endpoint."""
+        return self.client.get_circuit_breaker_stats()
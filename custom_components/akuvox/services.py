@@ -0,0 +1,138 @@
+"""Services for akuvox."""
+from __future__ import annotations
+
+import asyncio
+import time
+
+import voluptuous as vol
+
+from homeassistant.components.button import DOMAIN as BUTTON_DOMAIN
+from homeassistant.components.group import expand_entity_ids
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_registry as er
+
+from .const import (
+    DOMAIN,
+    LOGGER,
+    OPEN_DOORS_MAX_CONCURRENT,
+    SERVICE_OPEN_DOORS,
+)
+from .button import AkuvoxDoorRelayEntity
+from .coordinator import AkuvoxDataUpdateCoordinator
+
+OPEN_DOORS_SCHEMA = vol.All(
+    vol.Schema({
+        vol.Optional("entity_id", default=[]): cv.entity_ids,
+        vol.Optional("relays", default=[]): vol.All(cv.ensure_list, [cv.string]),
+    }),
+    cv.has_at_least_one_key("entity_id", "relays"),
+)
+
+
+def get_relay_unique_id(door_relay: dict) -> str:
+    """Return the unique ID of a door relay's button entity."""
+    return f"{door_relay['name']}, {door_relay['relay_id']}"
+
+
+async def async_get_door_relays(hass: HomeAssistant) -> list[tuple[AkuvoxDataUpdateCoordinator, dict]]:
+    """Return every door relay of every account, with its coordinator."""
+    door_relays = []
+    for coordinator in hass.data.get(DOMAIN, {}).values():
+        device_data = await coordinator.async_get_device_data()
+        for door_relay in (device_data or {}).get("door_relay_data", []):
+            door_relays.append((coordinator, door_relay))
+    return door_relays
+
+
+def get_door_relay_entity(hass: HomeAssistant, door_relay: dict) -> AkuvoxDoorRelayEntity | None:
+    """Return the button entity of a door relay, if it is loaded."""
+    entity_id = er.async_get(hass).async_get_entity_id(
+        BUTTON_DOMAIN, DOMAIN, get_relay_unique_id(door_relay))
+    component = hass.data.get(BUTTON_DOMAIN)
+    entity = component.get_entity(entity_id) if component and entity_id else None
+    return entity if isinstance(entity, AkuvoxDoorRelayEntity) else None
+
+
+def match_door_relay(door_relay: dict, relay: str) -> bool:
+    """Match a relay by its entity name, door name, device name (all of its relays) or MAC:relay ID."""
+    relay = relay.strip().lower()
+    return relay in (
+        get_relay_unique_id(door_relay).lower(),
+        str(door_relay.get("door_name", "")).lower(),
+        str(door_relay["name"]).lower(),
+        f"{door_relay['mac']}:{door_relay['relay_id']}".lower(),
+    )
+
+
+async def async_open_doors(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Open several doors concurrently and report the outcome of each."""
+    entity_registry = er.async_get(hass)
+    unique_ids = set()
+    for entity_id in expand_entity_ids(hass, call.data["entity_id"]):
+        entry = entity_registry.async_get(entity_id)
+        if entry is None or entry.platform != DOMAIN or entry.domain != BUTTON_DOMAIN:
+            raise HomeAssistantError(f"{entity_id} is not an Akuvox door relay")
+        unique_ids.add(entry.unique_id)
+
+    targets = [
+        (coordinator, door_relay)
+        for coordinator, door_relay in await async_get_door_relays(hass)
+        if get_relay_unique_id(door_relay) in unique_ids
+        or any(match_door_relay(door_relay, relay) for relay in call.data["relays"])
+    ]
+    if len(targets) == 0:
+        raise HomeAssistantError("No matching Akuvox door relays found")
+
+    LOGGER.debug("🚪 Opening %s door%s", str(len(targets)), "" if len(targets) == 1 else "s")
+    semaphore = asyncio.Semaphore(OPEN_DOORS_MAX_CONCURRENT)
+
+    async def async_open(coordinator: AkuvoxDataUpdateCoordinator, door_relay: dict) -> dict:
+        async with semaphore:
+            # Press through the button entity, so that its last_press_* attributes are updated
+            if (entity := get_door_relay_entity(hass, door_relay)) is not None:
+                result = await entity.async_open_door()
+            else:
+                client = coordinator.client
+                result = await client.async_open_door(
+                    name=get_relay_unique_id(door_relay),
+                    host=client.get_host(),
+                    token=client.get_token(),
+                    data=f"mac={door_relay['mac']}&relay={door_relay['relay_id']}")
+        return {
+            **result.as_dict(),
+            "mac": door_relay["mac"],
+            "relay_id": door_relay["relay_id"],
+        }
+
+    started_at = time.monotonic()
+    results = await asyncio.gather(*(async_open(*target) for target in targets))
+    return {
+        "results": list(results),
+        "succeeded": sum(1 for result in results if result["success"]),
+        "failed": sum(1 for result in results if not result["success"]),
+        "total_time": round(time.monotonic() - started_at, 3),
+    }
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services."""
+    if hass.services.has_service(DOMAIN, SERVICE_OPEN_DOORS):
+        return
+
+    async def async_handle_open_doors(call: ServiceCall) -> ServiceResponse:
+        return await async_open_doors(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_OPEN_DOORS,
+        async_handle_open_doors,
+        schema=OPEN_DOORS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL)
+
+
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Remove the integration's services once no entry is left."""
+    if not hass.data.get(DOMAIN):
+        hass.services.async_remove(DOMAIN, SERVICE_OPEN_DOORS)
@@ -0,0 +1,44 @@
+"""Coalescing of identical in-flight requests."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+
+class AkuvoxSingleFlight:
+    """Share one in-flight call and its result between concurrent identical callers."""
+
+    def __init__(self) -> None:
+        """Initialize the in-flight call table and counters."""
+        self._in_flight: dict[Hashable, asyncio.Future] = {}
+        self.executed: int = 0
+        self.coalesced: int = 0
+
+    async def async_do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Run func, or join the call already in flight for the same key."""
+        future = self._in_flight.get(key)
+        if future is None:
+            self.executed += 1
+            future = asyncio.ensure_future(func())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda done: self._async_call_done(key, done))
+        else:
+            self.coalesced += 1
+        # Shielded so that one cancelled caller does not cancel the shared call
+        return await asyncio.shield(future)
+
+    def _async_call_done(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        if not future.cancelled():
+            # Mark the exception as retrieved in case every caller was cancelled
+            future.exception()
+
+    def get_stats(self) -> dict:
+        """Return single-flight statistics."""
+        return {
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._in_flight),
+        }
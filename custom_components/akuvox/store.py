@@ -0,0 +1,119 @@
+"""Versioned storage for the akuvox integration."""
+from __future__ import annotations
+
+import hashlib
+import json
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import storage
+
+from .const import (
+    DOMAIN,
+    LOGGER,
+    DATA_STORAGE_KEY,
+    DATA_STORAGE_VERSION,
+    STATE_STORAGE_KEY,
+    STATE_STORAGE_VERSION,
+    STATE_STORAGE_KEYS,
+)
+
+
+class AkuvoxStore(storage.Store):
+    """JSON store that skips writes when the content has not changed."""
+
+    def __init__(self, hass: HomeAssistant, version: int, key: str, state_key: str | None = None) -> None:
+        """Initialize the store.
+
+        state_key is the key of the state store that receives the runtime
+        state split off a version 1 device store.
+        """
+        super().__init__(hass, version, key)
+        self._content_hash: str | None = None
+        self.state_key = state_key
+
+    @staticmethod
+    def get_content_hash(data) -> str:
+        """Return a stable hash of JSON serializable data."""
+        serialized = json.dumps(data, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(serialized, digest_size=16).hexdigest()
+
+    async def async_load(self):
+        """Load the data and remember its content hash."""
+        data = await super().async_load()
+        if data is not None:
+            self._content_hash = self.get_content_hash(data)
+        return data
+
+    async def async_save(self, data) -> None:
+        """Save the data unless it is identical to what was last loaded or saved."""
+        content_hash = self.get_content_hash(data)
+        if content_hash == self._content_hash:
+            return
+        self._content_hash = content_hash
+        await super().async_save(data)
+
+    def async_delay_save_if_changed(self, data: dict, delay: float) -> None:
+        """Schedule a delayed save of the data unless nothing changed."""
+        content_hash = self.get_content_hash(data)
+        if content_hash == self._content_hash:
+            return
+        self._content_hash = content_hash
+        self.async_delay_save(lambda: data, delay)
+
+    async def async_flush(self, data) -> None:
+        """Write the data right away, replacing a pending delayed save."""
+        self._content_hash = self.get_content_hash(data)
+        await super().async_save(data)
+
+    async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
+        """Migrate stored data to the current schema."""
+        if self.state_key is not None and old_major_version == 1:
+            # Version 1 kept the runtime state in the same blob as the device data
+            LOGGER.debug("Migrating device storage from version %s to %s",
+                         str(old_major_version),
+                         str(self.version))
+            old_data = dict(old_data or {})
+            state = {key: old_data.pop(key) for key in STATE_STORAGE_KEYS if key in old_data}
+            # Version 1 predates the state store: write it before the migrated
+            # device data is returned, so that no reader can miss the state
+            if state:
+                await AkuvoxStore(self.hass, STATE_STORAGE_VERSION, self.state_key).async_save(state)
+        return old_data
+
+
+def get_device_store(hass: HomeAssistant, entry_id: str) -> AkuvoxStore:
+    """Return the entry's store for the device and configuration data (cold, rarely written)."""
+    return AkuvoxStore(hass, DATA_STORAGE_VERSION, f"{DATA_STORAGE_KEY}_{entry_id}")
+
+
+def get_state_store(hass: HomeAssistant, entry_id: str) -> AkuvoxStore:
+    """Return the entry's store for the door log cursor and other runtime state (hot)."""
+    return AkuvoxStore(hass, STATE_STORAGE_VERSION, f"{STATE_STORAGE_KEY}_{entry_id}")
+
+
+async def async_import_legacy_storage(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Move the integration-wide storage of older versions into the entry's stores, once.
+
+    The legacy storage held a single account's data. It is imported by the
+    entry of that account, or by the only entry, and removed afterwards.
+    """
+    device_store = get_device_store(hass, entry.entry_id)
+    if await device_store.async_load() is not None:
+        return
+    legacy_device_store = AkuvoxStore(hass, DATA_STORAGE_VERSION, DATA_STORAGE_KEY,
+                                      state_key=STATE_STORAGE_KEY)
+    legacy_data = await legacy_device_store.async_load()
+    if not legacy_data:
+        return
+    if len(hass.config_entries.async_entries(DOMAIN)) > 1 \
+            and legacy_data.get("token") != entry.data.get("token"):
+        return
+    LOGGER.debug("Importing the integration-wide storage into entry %s", entry.entry_id)
+    legacy_state_store = AkuvoxStore(hass, STATE_STORAGE_VERSION, STATE_STORAGE_KEY)
+    legacy_state = await legacy_state_store.async_load()
+    await device_store.async_save(legacy_data)
+    if legacy_state:
+        await get_state_store(hass, entry.entry_id).async_save(legacy_state)
+    await legacy_device_store.async_remove()
+    await legacy_state_store.async_remove()
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Mock of an Akuvox device's LAN HTTP API, for testing local door opens.
+
+Run from the repository root:
+
+    python3 scripts/mock_lan_device.py --port 8080 [--delay 0.5] [--status 200]
+
+Then set the integration's local relays option to the device's MAC and
+this mock's base URL, e.g. "0C1105123456=http://127.0.0.1:8080". Use
+--delay above the local timeout or --status 500 to test the cloud fallback.
+"""
+import argparse
+import asyncio
+
+from aiohttp import web
+
+
+def main():
+    """Serve the mock device API until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--delay", type=float, default=0.0, help="Seconds to wait before responding")
+    parser.add_argument("--status", type=int, default=200, help="HTTP status code to respond with")
+    args = parser.parse_args()
+
+    async def handle_fcgi_do(request: web.Request) -> web.Response:
+        action = request.query.get("action")
+        door_num = request.query.get("DoorNum")
+        print(f"{request.method} {request.path_qs} (action={action}, DoorNum={door_num})")  # noqa: T201
+        await asyncio.sleep(args.delay)
+        if action != "OpenDoor" or door_num is None:
+            return web.Response(status=400, text="Bad request")
+        return web.Response(status=args.status, text="OK" if args.status == 200 else "Error")
+
+    app = web.Application()
+    app.router.add_get("/fcgi/do", handle_fcgi_do)
+    web.run_app(app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
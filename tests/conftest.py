@@ -0,0 +1,17 @@
+"""Load the integration's modules without importing Home Assistant's integration setup."""
+import contextlib
+import sys
+import types
+from pathlib import Path
+
+# The package's __init__ sets up Home Assistant platforms: register the
+# package without running it, as scripts/benchmark_endpoints.py does
+PACKAGE_DIR = Path(__file__).resolve().parent.parent / "custom_components" / "akuvox"
+package = types.ModuleType("akuvox")
+package.__path__ = [str(PACKAGE_DIR)]
+sys.modules.setdefault("akuvox", package)
+
+# Import Home Assistant's components in the order its startup does, which
+# avoids circular imports between the http and websocket_api components
+with contextlib.suppress(ImportError):
+    import homeassistant.bootstrap  # noqa: F401
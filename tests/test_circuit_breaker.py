@@ -0,0 +1,84 @@
+"""Tests for the per-endpoint circuit breakers."""
+import pytest
+
+from akuvox.circuit_breaker import AkuvoxCircuitBreaker, AkuvoxCircuitBreakers, parse_retry_after
+from akuvox.const import CIRCUIT_CLOSED, CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_HALF_OPEN, CIRCUIT_OPEN
+
+
+def test_opens_after_consecutive_failures():
+    """The circuit opens at the failure threshold and rejects requests."""
+    breaker = AkuvoxCircuitBreaker("getDoorLog")
+    for _ in range(CIRCUIT_FAILURE_THRESHOLD - 1):
+        assert not breaker.record_failure()
+    assert breaker.record_failure()
+    assert breaker.state == CIRCUIT_OPEN
+    assert not breaker.allow_request()
+    assert breaker.get_stats()["rejected"] == 1
+
+
+def test_half_open_lets_a_single_probe_through():
+    """Once the delay passes, one probe is let through; success closes the circuit."""
+    breaker = AkuvoxCircuitBreaker("getDoorLog")
+    breaker.record_failure(retry_after=0)
+    assert breaker.allow_request()
+    assert breaker.state == CIRCUIT_HALF_OPEN
+    assert not breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CIRCUIT_CLOSED
+    assert breaker.allow_request()
+
+
+def test_failed_probe_opens_the_circuit_again():
+    """A failed probe opens the circuit right away."""
+    breaker = AkuvoxCircuitBreaker("getDoorLog")
+    breaker.record_failure(retry_after=0)
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == CIRCUIT_OPEN
+    assert breaker.get_retry_in() > 0
+
+
+def test_worst_state_across_endpoints():
+    """The account's state is the worst state of its endpoints."""
+    breakers = AkuvoxCircuitBreakers()
+    assert breakers.get_state() == CIRCUIT_CLOSED
+    breakers.get("userconf")
+    breakers.get("getDoorLog").record_failure(retry_after=60)
+    assert breakers.get_state() == CIRCUIT_OPEN
+
+
+def test_parse_retry_after():
+    """Retry-After is either a number of seconds or an HTTP date."""
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after("-5") == 0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_rejected_response_bodies_open_the_circuit():
+    """HTTP 200 responses rejecting the request, e.g. for an invalid token, count as failures."""
+    pytest.importorskip("homeassistant")
+    from akuvox.api import AkuvoxApiClient
+
+    client = AkuvoxApiClient(session=None, hass=None, entry=None)  # type: ignore
+    breaker = AkuvoxCircuitBreaker("getDoorLog")
+    url = "https://ecloud.akuvox.com/getDoorLog"
+    assert client.process_response(200, b'{"result": 0, "datas": []}', url, breaker) == []
+    for _ in range(CIRCUIT_FAILURE_THRESHOLD):
+        assert client.process_response(200, b'{"result": 1, "message": "Token invalid"}', url, breaker) is None
+    assert breaker.state == CIRCUIT_OPEN
+
+
+def test_rejected_temp_key_responses_count_as_failures():
+    """Temp key responses with a non-zero code are empty, and count as failures."""
+    pytest.importorskip("homeassistant")
+    from akuvox.api import AkuvoxApiClient
+
+    client = AkuvoxApiClient(session=None, hass=None, entry=None)  # type: ignore
+    breaker = AkuvoxCircuitBreaker("getPersonalTempKeyList")
+    url = "https://ecloud.akuvox.com/getPersonalTempKeyList"
+    assert client.process_response(200, b'{"code": 1}', url, breaker) == []
+    assert breaker.consecutive_failures == 1
+    client.process_response(200, b'{"code": 0, "data": []}', url, breaker)
+    assert breaker.consecutive_failures == 0
@@ -0,0 +1,42 @@
+"""Tests for the door event dedupe window."""
+from akuvox.dedupe import AkuvoxDoorEventDedupe
+
+
+def door_log(capture_time: str, relay: str = "0", **values) -> dict:
+    """Return a door log entry."""
+    return {
+        "MAC": "0C1105000001",
+        "Relay": relay,
+        "CaptureTime": capture_time,
+        "Initiator": "Visitor",
+        "CaptureType": "Call",
+        **values,
+    }
+
+
+def test_contains_added_entries_only():
+    """Entries are seen once added, and duplicates are counted."""
+    dedupe = AkuvoxDoorEventDedupe()
+    assert not dedupe.contains(door_log("2024-01-01 10:00:00"))
+    dedupe.add(door_log("2024-01-01 10:00:00"))
+    assert dedupe.contains(door_log("2024-01-01 10:00:00", PicUrl="https://example.com/pic.jpg"))
+    assert dedupe.get_stats()["duplicates"] == 1
+
+
+def test_key_tells_relays_apart_within_the_same_second():
+    """Two relays triggered within the same second are different events."""
+    dedupe = AkuvoxDoorEventDedupe()
+    dedupe.add(door_log("2024-01-01 10:00:00", relay="0"))
+    assert not dedupe.contains(door_log("2024-01-01 10:00:00", relay="1"))
+
+
+def test_evicts_least_recently_seen_entry():
+    """The window is bounded, and lookups refresh an entry's recency."""
+    dedupe = AkuvoxDoorEventDedupe(max_size=2)
+    dedupe.add(door_log("2024-01-01 10:00:00"))
+    dedupe.add(door_log("2024-01-01 10:00:01"))
+    assert dedupe.contains(door_log("2024-01-01 10:00:00"))
+    dedupe.add(door_log("2024-01-01 10:00:02"))
+    assert dedupe.contains(door_log("2024-01-01 10:00:00"))
+    assert not dedupe.contains(door_log("2024-01-01 10:00:01"))
+    assert dedupe.get_stats()["evictions"] == 1
@@ -0,0 +1,109 @@
+"""Tests for door log parsing: the cursor, catching up on new entries and held back entries."""
+import asyncio
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from akuvox.api import AkuvoxApiClient  # noqa: E402
+from akuvox.data import AkuvoxData  # noqa: E402
+
+PIC_URL = "https://example.com/pic.jpg"
+
+
+def door_log(second: int, pic_url: str = PIC_URL) -> dict:
+    """Return a door log entry captured at the given second."""
+    return {
+        "MAC": "0C1105000001",
+        "Relay": "0",
+        "CaptureTime": f"2024-01-01 10:00:{second:02d}",
+        "Initiator": "Visitor",
+        "CaptureType": "Call",
+        "Location": "Front Door",
+        "PicUrl": pic_url,
+    }
+
+
+def response(*door_logs: dict) -> list[dict]:
+    """Return a getDoorLog response: the entries, newest first."""
+    return sorted(door_logs, key=lambda entry: entry["CaptureTime"], reverse=True)
+
+
+def capture_times(door_logs: list[dict]) -> list[str]:
+    """Return the capture times of door log entries."""
+    return [entry["CaptureTime"] for entry in door_logs]
+
+
+def parse(data: AkuvoxData, json_data: list[dict]) -> list[dict]:
+    """Parse a getDoorLog response."""
+    return asyncio.run(data.async_parse_personal_door_log(json_data))
+
+
+def get_data(wait_for_image_url: bool = False) -> AkuvoxData:
+    """Return the data of a client without a config entry, which keeps its state in memory."""
+    return AkuvoxData(entry=None, hass=None, wait_for_image_url=wait_for_image_url)  # type: ignore
+
+
+def test_first_poll_only_sets_the_cursor():
+    """The entries present when polling starts are not fired."""
+    data = get_data()
+    assert parse(data, response(door_log(1), door_log(2))) == []
+    assert data.latest_door_log["CaptureTime"] == door_log(2)["CaptureTime"]
+
+
+def test_catches_up_on_every_new_entry_in_order():
+    """All entries newer than the cursor fire once, oldest first."""
+    data = get_data()
+    parse(data, response(door_log(1)))
+    new_door_logs = parse(data, response(door_log(1), door_log(2), door_log(3), door_log(4)))
+    assert capture_times(new_door_logs) == capture_times([door_log(2), door_log(3), door_log(4)])
+    assert not any(entry["Replayed"] for entry in new_door_logs)
+
+    # Entries already fired are not fired again
+    new_door_logs = parse(data, response(door_log(2), door_log(3), door_log(4), door_log(5)))
+    assert capture_times(new_door_logs) == capture_times([door_log(5)])
+
+
+def test_held_entry_keeps_the_cursor_before_it():
+    """In wait mode, an entry without a screenshot is held back and the cursor stays before it."""
+    data = get_data(wait_for_image_url=True)
+    parse(data, response(door_log(1)))
+    new_door_logs = parse(data, response(door_log(1), door_log(2, pic_url=""), door_log(3)))
+    assert capture_times(new_door_logs) == capture_times([door_log(3)])
+    assert len(data.pending_screenshots) == 1
+    assert data.latest_door_log["CaptureTime"] == door_log(1)["CaptureTime"]
+
+    # The screenshot shows up: the held entry fires and the cursor moves on
+    new_door_logs = parse(data, response(door_log(1), door_log(2), door_log(3)))
+    assert capture_times(new_door_logs) == capture_times([door_log(2)])
+    assert new_door_logs[0]["PicUrl"] == PIC_URL
+    assert len(data.pending_screenshots) == 0
+    assert data.latest_door_log["CaptureTime"] == door_log(3)["CaptureTime"]
+
+
+def test_entries_recovered_after_a_restart_are_replays():
+    """A restart recovers the entries after the persisted cursor, flagged as replays."""
+    data = get_data()
+    data.latest_door_log = door_log(1)
+    new_door_logs = parse(data, response(door_log(1), door_log(2), door_log(3)))
+    assert capture_times(new_door_logs) == capture_times([door_log(2), door_log(3)])
+    assert all(entry["Replayed"] for entry in new_door_logs)
+
+
+def test_stopping_the_client_drops_held_entries():
+    """Held entries neither fire nor trigger screenshot re-fetches once polling stopped."""
+    async def stop_with_held_entry():
+        client = AkuvoxApiClient(session=None, hass=None, entry=None)  # type: ignore
+        client.init_api_with_data(hass=None, subdomain="ecloud")  # type: ignore
+        client._data.wait_for_image_url = True
+        await client._data.async_parse_personal_door_log(response(door_log(1)))
+        await client._data.async_parse_personal_door_log(response(door_log(1), door_log(2, pic_url="")))
+        assert len(client._data.pending_screenshots) == 1
+
+        await client.async_stop_polling()
+        assert len(client._data.pending_screenshots) == 0
+        # Would need Home Assistant to schedule the re-fetch
+        client._data.pending_screenshots.add(("key",), door_log(3, pic_url=""))
+        client._schedule_pending_screenshot_refetch()
+
+    asyncio.run(stop_with_held_entry())
@@ -0,0 +1,146 @@
+"""Tests for the door log poller's deadlines and overlap policies."""
+import asyncio
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from akuvox.const import POLL_OVERLAP_OVERLAP, POLL_OVERLAP_SKIP, POLL_OVERLAP_WAIT  # noqa: E402
+from akuvox.door_poll import DoorLogPoller  # noqa: E402
+
+INTERVAL = 0.1
+
+
+class DoorLogPolls:
+    """Door log poll function recording when each poll started."""
+
+    def __init__(self, duration: float = 0) -> None:
+        """Initialize the poll function."""
+        self.duration = duration
+        self.started_at: list[float] = []
+
+    async def __call__(self) -> bool:
+        """Poll the door log."""
+        self.started_at.append(asyncio.get_running_loop().time())
+        await asyncio.sleep(self.duration)
+        return False
+
+
+async def async_poll_for(poller: DoorLogPoller, duration: float) -> None:
+    """Let the poller run for a while."""
+    await poller.async_start()
+    await asyncio.sleep(duration)
+    await poller.async_stop()
+
+
+def get_poller(polls: DoorLogPolls, overlap_policy: str = POLL_OVERLAP_SKIP) -> DoorLogPoller:
+    """Return a poller polling at a fixed interval."""
+    return DoorLogPoller(hass=None, poll_function=polls, interval=INTERVAL, overlap_policy=overlap_policy)  # type: ignore
+
+
+def test_polls_fire_on_fixed_deadlines():
+    """The poll's round trip does not stretch the period."""
+    polls = DoorLogPolls(duration=INTERVAL / 2)
+    asyncio.run(async_poll_for(get_poller(polls), 10.5 * INTERVAL))
+    # Polls stretched by their round trip would only start every 1.5 intervals
+    assert len(polls.started_at) in (10, 11)
+    average_period = (polls.started_at[-1] - polls.started_at[0]) / (len(polls.started_at) - 1)
+    assert average_period == pytest.approx(INTERVAL, rel=0.1)
+
+
+def test_skip_policy_skips_deadlines_while_a_poll_is_in_flight():
+    """With the default policy, polls never overlap."""
+    polls = DoorLogPolls(duration=2.5 * INTERVAL)
+    poller = get_poller(polls)
+    asyncio.run(async_poll_for(poller, 5.5 * INTERVAL))
+    stats = poller.get_stats()
+    assert stats["max_concurrent"] == 1
+    assert stats["skipped"] >= 3
+    assert stats["polls"] == 2
+
+
+def test_overlap_policy_staggers_polls_up_to_the_cap():
+    """With the overlap policy, polls are started at every deadline, up to max_in_flight at once."""
+    polls = DoorLogPolls(duration=10 * INTERVAL)
+    poller = get_poller(polls, overlap_policy=POLL_OVERLAP_OVERLAP)
+    asyncio.run(async_poll_for(poller, 5.5 * INTERVAL))
+    stats = poller.get_stats()
+    assert stats["max_concurrent"] == poller.max_in_flight
+    assert stats["polls"] == poller.max_in_flight
+    assert stats["skipped"] > 0
+
+
+def test_wait_policy_realigns_after_missed_deadlines():
+    """Waiting for a slow poll misses deadlines, which are dropped instead of fired in a burst."""
+    polls = DoorLogPolls(duration=2.5 * INTERVAL)
+    poller = get_poller(polls, overlap_policy=POLL_OVERLAP_WAIT)
+    asyncio.run(async_poll_for(poller, 5.5 * INTERVAL))
+    periods = [later - earlier for earlier, later in zip(polls.started_at, polls.started_at[1:])]
+    assert poller.get_stats()["missed_deadlines"] > 0
+    assert all(period > 2 * INTERVAL for period in periods)
+
+
+def test_activity_brings_the_next_deadline_forward():
+    """In adaptive mode, door activity switches a slow poller to its fastest rate right away."""
+    async def poll_with_activity():
+        poller = DoorLogPoller(hass=None, poll_function=polls, adaptive=True,  # type: ignore
+                               interval_min=0.5, interval_max=60)
+        # Idle for long: the interval decays from 30 to 45 seconds after the first poll
+        poller.interval = 30
+        poller._last_activity -= 3600
+        await poller.async_start()
+        await asyncio.sleep(0.1)
+        poller.notify_activity()
+        await asyncio.sleep(0.6)
+        await poller.async_stop()
+
+    polls = DoorLogPolls()
+    asyncio.run(poll_with_activity())
+    assert len(polls.started_at) == 2
+    assert polls.started_at[1] - polls.started_at[0] == pytest.approx(0.5, abs=0.1)
+
+
+def test_watchdog_restarts_a_dead_poll_loop():
+    """A poll loop that dies while polling is restarted after a backoff."""
+    async def poll_with_crash():
+        poller = get_poller(polls)
+        poller._restart_backoff = INTERVAL
+        fire_poll = poller._async_fire_poll
+        crashes = []
+
+        async def crash_once():
+            if not crashes:
+                crashes.append(None)
+                raise RuntimeError("Poll loop crashed")
+            await fire_poll()
+
+        poller._async_fire_poll = crash_once
+        await async_poll_for(poller, 4 * INTERVAL)
+        return poller
+
+    polls = DoorLogPolls()
+    poller = asyncio.run(poll_with_crash())
+    assert poller.get_stats()["restarts"] == 1
+    assert len(polls.started_at) > 0
+
+
+def test_stopping_cancels_a_pending_restart():
+    """A poller stopped while waiting for the watchdog stays stopped."""
+    async def stop_while_dead():
+        poller = get_poller(polls)
+        poller._restart_backoff = INTERVAL
+
+        async def crash():
+            raise RuntimeError("Poll loop crashed")
+
+        poller._async_fire_poll = crash
+        await poller.async_start()
+        await asyncio.sleep(INTERVAL / 2)
+        await poller.async_stop()
+        await asyncio.sleep(2 * INTERVAL)
+        return poller
+
+    polls = DoorLogPolls()
+    poller = asyncio.run(stop_while_dead())
+    assert poller.get_stats()["restarts"] == 1
+    assert not poller.is_polling
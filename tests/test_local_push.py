@@ -0,0 +1,81 @@
+"""Tests for matching door events pushed on the LAN with cloud door log entries."""
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from akuvox.local_push import AkuvoxLocalPush, AkuvoxLocalPushes  # noqa: E402
+
+PUSHED_AT = datetime(2024, 1, 1, 10, 0, 0)
+
+
+def push(relay: str = "0", event: str = "Call") -> AkuvoxLocalPush:
+    """Return a door event pushed by the device."""
+    return AkuvoxLocalPush(mac="0C1105000001", relay=relay, event=event, door_log={}, captured_at=PUSHED_AT)
+
+
+def cloud_door_log(relay: str = "0", capture_type: str = "Call", delay: float = 3) -> dict:
+    """Return the cloud door log entry of a door event captured delay seconds after the push."""
+    return {
+        "MAC": "0c:11:05:00:00:01",
+        "Relay": relay,
+        "CaptureTime": (PUSHED_AT + timedelta(seconds=delay)).strftime("%Y-%m-%d %H:%M:%S"),
+        "CaptureType": capture_type,
+    }
+
+
+def test_matches_the_cloud_entry_of_the_pushed_event_once():
+    """The cloud entry of a pushed event is matched once, then the push is gone."""
+    pushes = AkuvoxLocalPushes()
+    assert pushes.add(push())
+    assert pushes.pop(cloud_door_log()) is not None
+    assert pushes.pop(cloud_door_log()) is None
+    assert pushes.get_stats()["matched_cloud"] == 1
+
+
+def test_ignores_repeated_callbacks():
+    """A callback repeated within the repeat window is ignored."""
+    pushes = AkuvoxLocalPushes()
+    assert pushes.add(push())
+    assert not pushes.add(push())
+    assert pushes.add(push(event="Unlock"))
+    assert len(pushes) == 2
+
+
+def test_does_not_match_other_event_types():
+    """A call push does not swallow an unlock of the same door."""
+    pushes = AkuvoxLocalPushes()
+    pushes.add(push(event="Call"))
+    assert pushes.find(cloud_door_log(capture_type="Face Unlock")) is None
+    assert pushes.find(cloud_door_log(capture_type="call")) is not None
+
+
+def test_does_not_match_entries_captured_far_from_the_push():
+    """Cloud entries must be captured within the capture window of the push."""
+    pushes = AkuvoxLocalPushes(capture_window=30)
+    pushes.add(push())
+    assert pushes.find(cloud_door_log(delay=45)) is None
+    assert pushes.find(cloud_door_log(delay=-45)) is None
+    assert pushes.find(cloud_door_log(delay=-5)) is not None
+    assert pushes.find({**cloud_door_log(), "CaptureTime": "not a time"}) is None
+
+
+def test_relays():
+    """Pushes with a relay match that relay only, pushes without one match any relay."""
+    pushes = AkuvoxLocalPushes()
+    pushes.add(push(relay="1"))
+    assert pushes.find(cloud_door_log(relay="0")) is None
+    assert pushes.find(cloud_door_log(relay="1")) is not None
+
+    pushes = AkuvoxLocalPushes()
+    pushes.add(push(relay=""))
+    assert pushes.find(cloud_door_log(relay="1")) is not None
+
+
+def test_forgets_pushes_after_the_match_window():
+    """Pushes whose cloud entry never shows up expire."""
+    pushes = AkuvoxLocalPushes(match_window=0)
+    pushes.add(push())
+    assert pushes.find(cloud_door_log()) is None
+    assert pushes.get_stats()["unmatched_cloud"] == 1
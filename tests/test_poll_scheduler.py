@@ -0,0 +1,135 @@
+"""Tests for the door log poll scheduler shared by all entries."""
+import asyncio
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from akuvox.api import AkuvoxApiClient  # noqa: E402
+from akuvox.const import DOOR_LOG_EVENT  # noqa: E402
+from akuvox.door_poll import DoorLogPoller  # noqa: E402
+from akuvox.poll_scheduler import AkuvoxPollScheduler  # noqa: E402
+
+INTERVAL = 0.05
+
+
+class DoorLogPolls:
+    """Door log poll function counting its calls."""
+
+    def __init__(self, duration: float = 0) -> None:
+        """Initialize the poll function."""
+        self.duration = duration
+        self.calls = 0
+
+    async def __call__(self) -> bool:
+        """Poll the door log."""
+        self.calls += 1
+        await asyncio.sleep(self.duration)
+        return False
+
+
+def get_poller(hass: HomeAssistant, polls: DoorLogPolls) -> DoorLogPoller:
+    """Return a poller polling at a short fixed interval."""
+    return DoorLogPoller(hass=hass, poll_function=polls, interval=INTERVAL)
+
+
+def run_with_hass(test) -> None:
+    """Run a test coroutine function with a Home Assistant instance."""
+    async def async_run():
+        hass = HomeAssistant()
+        try:
+            await test(hass)
+        finally:
+            await hass.async_stop(force=True)
+
+    asyncio.run(async_run())
+
+
+def test_entries_of_the_same_account_share_one_poller():
+    """Only the first entry of an account polls, and the next one takes over when it is removed."""
+    async def test(hass: HomeAssistant):
+        scheduler = AkuvoxPollScheduler(hass)
+        first_polls, second_polls, other_polls = DoorLogPolls(), DoorLogPolls(), DoorLogPolls()
+        assert await scheduler.async_add("first", "account", get_poller(hass, first_polls), client="first client")
+        assert not await scheduler.async_add("second", "account", get_poller(hass, second_polls), client="second client")
+        assert await scheduler.async_add("other", "other account", get_poller(hass, other_polls))
+        assert scheduler.get_polling_client("second") == "first client"
+        await asyncio.sleep(4 * INTERVAL)
+        assert first_polls.calls > 0
+        assert second_polls.calls == 0
+        assert other_polls.calls > 0
+
+        await scheduler.async_remove("first")
+        assert scheduler.is_polling_entry("second")
+        assert scheduler.get_polling_client("second") == "second client"
+        calls = first_polls.calls
+        await asyncio.sleep(4 * INTERVAL)
+        assert first_polls.calls == calls
+        assert second_polls.calls > 0
+
+        await scheduler.async_remove("second")
+        await scheduler.async_remove("other")
+        assert scheduler.get_stats()["accounts"] == 0
+
+    run_with_hass(test)
+
+
+def test_reloaded_entry_replaces_its_poller():
+    """Registering a new poller for an entry stops the one it replaces."""
+    async def test(hass: HomeAssistant):
+        scheduler = AkuvoxPollScheduler(hass)
+        old_polls, new_polls = DoorLogPolls(), DoorLogPolls()
+        old_poller = get_poller(hass, old_polls)
+        await scheduler.async_add("entry", "account", old_poller)
+        await asyncio.sleep(2 * INTERVAL)
+        await scheduler.async_add("entry", "account", get_poller(hass, new_polls))
+        assert not old_poller.is_polling
+        calls = old_polls.calls
+        await asyncio.sleep(4 * INTERVAL)
+        assert old_polls.calls == calls
+        assert new_polls.calls > 0
+        assert scheduler.get_stats()["replaced"] == 1
+        await scheduler.async_remove("entry")
+
+    run_with_hass(test)
+
+
+def test_polls_across_accounts_are_capped():
+    """At most max_concurrent polls run at once across all accounts."""
+    async def test(hass: HomeAssistant):
+        scheduler = AkuvoxPollScheduler(hass, max_concurrent=2)
+        polls = DoorLogPolls(duration=INTERVAL)
+        await asyncio.gather(*(scheduler.async_run(polls) for _ in range(5)))
+        stats = scheduler.get_stats()
+        assert polls.calls == 5
+        assert stats["max_concurrent_polls"] == 2
+        assert stats["throttled"] > 0
+
+    run_with_hass(test)
+
+
+def test_pushes_to_other_entries_are_handled_by_the_polling_client():
+    """A door event pushed to an entry that does not poll is matched by the polling entry's client."""
+    async def test(hass: HomeAssistant):
+        scheduler = AkuvoxPollScheduler(hass)
+        clients = []
+        for entry_id in ("first", "second"):
+            client = AkuvoxApiClient(session=None, hass=hass, entry=None, poll_scheduler=scheduler)  # type: ignore
+            client.init_api_with_data(hass=hass, subdomain="ecloud")
+            client._entry_id = entry_id
+            await scheduler.async_add(entry_id, "account", get_poller(hass, DoorLogPolls()), client=client)
+            clients.append(client)
+        events = []
+        hass.bus.async_listen(DOOR_LOG_EVENT, events.append)
+
+        clients[1].async_handle_local_push({"mac": "0C1105000001", "relay": "0", "event": "Call"})
+        await hass.async_block_till_done()
+        assert len(events) == 1
+        assert len(clients[0]._data.local_pushes) == 1
+        assert len(clients[1]._data.local_pushes) == 0
+        await scheduler.async_remove("first")
+        await scheduler.async_remove("second")
+
+    run_with_hass(test)
@@ -0,0 +1,139 @@
+"""Tests for the priority request scheduler of an account."""
+import asyncio
+
+import pytest
+
+from akuvox.const import REQUEST_PRIORITY_BACKGROUND, REQUEST_PRIORITY_INTERACTIVE, REQUEST_PRIORITY_POLLING
+from akuvox.request_scheduler import AkuvoxRequestScheduler
+
+DURATION = 0.2
+
+
+def request(duration: float = DURATION, started: list | None = None, name: str = ""):
+    """Return a request function that takes a while, recording when it started."""
+    async def async_request():
+        if started is not None:
+            started.append((name, asyncio.get_running_loop().time()))
+        await asyncio.sleep(duration)
+        return name
+
+    return async_request
+
+
+async def async_fill(scheduler: AkuvoxRequestScheduler, priority: int = REQUEST_PRIORITY_POLLING) -> list[asyncio.Task]:
+    """Take every slot of the scheduler with long requests."""
+    tasks = [asyncio.ensure_future(scheduler.async_run(priority, request()))
+             for _ in range(scheduler.max_concurrent)]
+    await asyncio.sleep(0)
+    return tasks
+
+
+def test_interactive_requests_never_wait_for_a_slot():
+    """A door open is sent right away while every slot is taken by polls."""
+    async def open_door_while_busy():
+        scheduler = AkuvoxRequestScheduler()
+        tasks = await async_fill(scheduler)
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        await scheduler.async_run(REQUEST_PRIORITY_INTERACTIVE, request(duration=0))
+        waited = loop.time() - started_at
+        await asyncio.gather(*tasks)
+        return waited
+
+    assert asyncio.run(open_door_while_busy()) < DURATION / 4
+
+
+def test_interactive_requests_skip_the_token_bucket():
+    """A door open is sent right away when the rate limit holds back other requests."""
+    async def open_door_without_tokens():
+        scheduler = AkuvoxRequestScheduler(rate=1, burst=1)
+        await scheduler.async_run(REQUEST_PRIORITY_POLLING, request(duration=0))
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        await scheduler.async_run(REQUEST_PRIORITY_INTERACTIVE, request(duration=0))
+        return loop.time() - started_at
+
+    assert asyncio.run(open_door_without_tokens()) < DURATION / 4
+
+
+def test_waiting_requests_are_served_by_priority_then_arrival():
+    """Polls waiting for a slot are served before background requests."""
+    async def run_queued():
+        scheduler = AkuvoxRequestScheduler(max_concurrent=1)
+        started = []
+        tasks = await async_fill(scheduler)
+        tasks += [asyncio.ensure_future(scheduler.async_run(priority, request(0.01, started, name)))
+                  for priority, name in ((REQUEST_PRIORITY_BACKGROUND, "background 1"),
+                                         (REQUEST_PRIORITY_POLLING, "polling 1"),
+                                         (REQUEST_PRIORITY_BACKGROUND, "background 2"),
+                                         (REQUEST_PRIORITY_POLLING, "polling 2"))]
+        await asyncio.gather(*tasks)
+        return [name for name, _started_at in started]
+
+    assert asyncio.run(run_queued()) == ["polling 1", "polling 2", "background 1", "background 2"]
+
+
+def test_token_bucket_limits_the_request_rate():
+    """Requests beyond the burst are spread out at the refill rate."""
+    async def run_burst():
+        scheduler = AkuvoxRequestScheduler(rate=10, burst=2)
+        started = []
+        await asyncio.gather(*(scheduler.async_run(REQUEST_PRIORITY_POLLING, request(0, started))
+                               for _ in range(4)))
+        return [started_at for _name, started_at in started]
+
+    started_at = asyncio.run(run_burst())
+    assert started_at[1] - started_at[0] < 0.05
+    assert started_at[3] - started_at[0] == pytest.approx(0.2, abs=0.05)
+
+
+def test_cancelled_waiters_do_not_leak_slots():
+    """A request cancelled while queued neither runs nor keeps a slot."""
+    async def cancel_queued():
+        scheduler = AkuvoxRequestScheduler(max_concurrent=1)
+        started = []
+        tasks = await async_fill(scheduler)
+        cancelled = asyncio.ensure_future(scheduler.async_run(REQUEST_PRIORITY_POLLING,
+                                                              request(0, started, "cancelled")))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.gather(*tasks)
+        assert await scheduler.async_run(REQUEST_PRIORITY_POLLING, request(0, started, "next")) == "next"
+        return scheduler, started
+
+    scheduler, started = asyncio.run(cancel_queued())
+    assert [name for name, _started_at in started] == ["next"]
+    assert scheduler.get_stats()["running"] == 0
+
+
+def test_time_spent_queued_is_not_a_request_timeout(monkeypatch):
+    """Requests time out after their slot was granted, and queueing is no endpoint failure."""
+    pytest.importorskip("homeassistant")
+    from akuvox import api
+    from akuvox.api import AkuvoxApiClient, AkuvoxApiClientCommunicationError
+
+    monkeypatch.setattr(api, "REQUEST_TIMEOUT", DURATION / 2)
+    url = "https://ecloud.akuvox.com/getDoorLog"
+
+    async def request_while_busy():
+        client = AkuvoxApiClient(session=None, hass=None, entry=None)  # type: ignore
+        client.init_api_with_data(hass=None, subdomain="ecloud")  # type: ignore
+        duration = DURATION / 4
+
+        async def async_make_request(*_args):
+            await asyncio.sleep(duration)
+            return {"result": "ok"}
+
+        client.async_make_request = async_make_request
+        tasks = await async_fill(client._request_scheduler, REQUEST_PRIORITY_BACKGROUND)
+        # Queued for longer than the timeout, then answered in time
+        assert await client._async_api_wrapper(method="get", url=url, data={},
+                                               priority=REQUEST_PRIORITY_POLLING) == {"result": "ok"}
+        await asyncio.gather(*tasks)
+
+        duration = DURATION
+        with pytest.raises(AkuvoxApiClientCommunicationError):
+            await client._async_api_wrapper(method="get", url=url, data={}, priority=REQUEST_PRIORITY_POLLING)
+        return client._circuit_breakers.get("/getDoorLog")
+
+    assert asyncio.run(request_while_busy()).consecutive_failures == 1
@@ -0,0 +1,65 @@
+"""Tests for the coalescing of identical in-flight requests."""
+import asyncio
+
+import pytest
+
+from akuvox.single_flight import AkuvoxSingleFlight
+
+
+def test_concurrent_identical_calls_share_one_call():
+    """Concurrent callers with the same key share the call and its result."""
+    calls = []
+
+    async def fetch():
+        calls.append(None)
+        await asyncio.sleep(0.01)
+        return {"devices": []}
+
+    async def fetch_concurrently():
+        single_flight = AkuvoxSingleFlight()
+        results = await asyncio.gather(
+            single_flight.async_do("userconf", fetch),
+            single_flight.async_do("userconf", fetch),
+            single_flight.async_do("getDoorLog", fetch))
+        return single_flight, results
+
+    single_flight, results = asyncio.run(fetch_concurrently())
+    assert len(calls) == 2
+    assert results[0] is results[1]
+    assert single_flight.get_stats() == {"executed": 2, "coalesced": 1, "in_flight": 0}
+
+
+def test_exceptions_reach_every_caller():
+    """A failed call raises in every caller sharing it."""
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("Request failed")
+
+    async def fail_concurrently():
+        single_flight = AkuvoxSingleFlight()
+        return await asyncio.gather(
+            single_flight.async_do("userconf", fail),
+            single_flight.async_do("userconf", fail),
+            return_exceptions=True)
+
+    results = asyncio.run(fail_concurrently())
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_a_cancelled_caller_does_not_cancel_the_shared_call():
+    """The other callers still get the result when one of them is cancelled."""
+    async def fetch():
+        await asyncio.sleep(0.02)
+        return "result"
+
+    async def cancel_one():
+        single_flight = AkuvoxSingleFlight()
+        cancelled = asyncio.ensure_future(single_flight.async_do("userconf", fetch))
+        waiting = asyncio.ensure_future(single_flight.async_do("userconf", fetch))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        return await waiting
+
+    assert asyncio.run(cancel_one()) == "result"
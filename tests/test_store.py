@@ -0,0 +1,99 @@
+"""Tests for the integration's versioned storage."""
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from akuvox.const import DATA_STORAGE_KEY, DATA_STORAGE_VERSION, STATE_STORAGE_KEY  # noqa: E402
+from akuvox.data import AkuvoxData  # noqa: E402
+from akuvox.store import AkuvoxStore, get_device_store, get_state_store  # noqa: E402
+
+ENTRY_ID = "entry_id"
+DOOR_LOG = {"MAC": "0C1105000001", "Relay": "0", "CaptureTime": "2024-01-01 10:00:00"}
+DEVICE_DATA = {"host": "ecloud.akuvox.com", "token": "token", "door_relay_data": []}
+
+
+def run_with_hass(config_dir, test) -> None:
+    """Run a test coroutine function with a Home Assistant instance storing files in config_dir."""
+    async def async_run():
+        hass = HomeAssistant()
+        hass.config.config_dir = str(config_dir)
+        try:
+            await test(hass)
+        finally:
+            await hass.async_stop(force=True)
+
+    asyncio.run(async_run())
+
+
+def test_flush_writes_the_delayed_save_right_away(tmp_path):
+    """A flushed door log cursor is read back by the next client, before the save delay."""
+    async def test(hass: HomeAssistant):
+        data = AkuvoxData(entry=None, hass=hass)  # type: ignore
+        data._state_store = get_state_store(hass, ENTRY_ID)
+        await data.async_set_stored_data_for_key("latest_door_log", DOOR_LOG)
+        assert await get_state_store(hass, ENTRY_ID).async_load() is None
+
+        await data.async_flush_stored_data()
+        assert await get_state_store(hass, ENTRY_ID).async_load() == {"latest_door_log": DOOR_LOG}
+
+    run_with_hass(tmp_path, test)
+
+
+def write_storage_file(config_dir, key: str, version: int, data: dict) -> None:
+    """Write a storage file as an earlier version of the integration did."""
+    storage_dir = config_dir / ".storage"
+    storage_dir.mkdir(exist_ok=True)
+    (storage_dir / key).write_text(json.dumps({"version": version, "minor_version": 1, "key": key, "data": data}))
+
+
+def test_version_1_storage_is_split_into_device_data_and_state(tmp_path):
+    """Migrating a version 1 store moves the runtime state into the state store."""
+    write_storage_file(tmp_path, DATA_STORAGE_KEY, 1, {
+        **DEVICE_DATA,
+        "latest_door_log": DOOR_LOG,
+        "app_type": "single",
+    })
+
+    async def test(hass: HomeAssistant):
+        store = AkuvoxStore(hass, DATA_STORAGE_VERSION, DATA_STORAGE_KEY, state_key=STATE_STORAGE_KEY)
+        assert await store.async_load() == DEVICE_DATA
+        assert await AkuvoxStore(hass, 1, STATE_STORAGE_KEY).async_load() == {
+            "latest_door_log": DOOR_LOG,
+            "app_type": "single",
+        }
+
+    run_with_hass(tmp_path, test)
+    migrated = json.loads((tmp_path / ".storage" / DATA_STORAGE_KEY).read_text())
+    assert migrated["version"] == DATA_STORAGE_VERSION
+
+
+def test_version_1_storage_without_state_leaves_the_state_store_alone(tmp_path):
+    """A version 1 store without runtime state does not create a state store."""
+    write_storage_file(tmp_path, DATA_STORAGE_KEY, 1, DEVICE_DATA)
+
+    async def test(hass: HomeAssistant):
+        store = AkuvoxStore(hass, DATA_STORAGE_VERSION, DATA_STORAGE_KEY, state_key=STATE_STORAGE_KEY)
+        assert await store.async_load() == DEVICE_DATA
+
+    run_with_hass(tmp_path, test)
+    assert not (tmp_path / ".storage" / STATE_STORAGE_KEY).exists()
+
+
+def test_unchanged_data_is_not_written_again(tmp_path):
+    """Saving the data that was last loaded or saved skips the write."""
+    async def test(hass: HomeAssistant):
+        store = get_device_store(hass, ENTRY_ID)
+        await store.async_save(DEVICE_DATA)
+        path = tmp_path / ".storage" / store.key
+        path.unlink()
+        await store.async_save(dict(DEVICE_DATA))
+        assert not path.exists()
+        await store.async_save({**DEVICE_DATA, "token": "new token"})
+        assert path.exists()
+
+    run_with_hass(tmp_path, test)